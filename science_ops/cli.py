@@ -1,34 +1,100 @@
 from __future__ import annotations
 
+import importlib
+from typing import TYPE_CHECKING
+
 import typer
-from rich.console import Console
+from typer.core import TyperGroup
 
 from . import __version__
-from .tools import (
-    constants,
-    units,
-    stats,
-    waves,
-    lab_notebook,
-    astro,
-    chem,
-    mech,
-    relativity,
-    bio,
-    data,
-    optics,
-    em,
-    analysis,
-    labcalc,
-    bioseq,
-    config_cli,
-)
+from .ui import console
+
+if TYPE_CHECKING:
+    import click
+
+# Sub-apps are imported only when their command is actually resolved, so
+# `ops --version` or `ops em coulomb` never pay for numpy or unrelated tools.
+_LAZY: dict[str, str] = {
+    "constants": "science_ops.tools.constants",
+    "units": "science_ops.tools.units",
+    "stats": "science_ops.tools.stats",
+    "waves": "science_ops.tools.waves",
+    "notebook": "science_ops.tools.lab_notebook",
+    "astro": "science_ops.tools.astro",
+    "chem": "science_ops.tools.chem",
+    "mech": "science_ops.tools.mech",
+    "relativity": "science_ops.tools.relativity",
+    "bio": "science_ops.tools.bio",
+    "data": "science_ops.tools.data",
+    "optics": "science_ops.tools.optics",
+    "em": "science_ops.tools.em",
+    "analysis": "science_ops.tools.analysis",
+    "labcalc": "science_ops.tools.labcalc",
+    "bioseq": "science_ops.tools.bioseq",
+    "config": "science_ops.tools.config_cli",
+}
+
+
+# Short help per sub-app, mirroring each module's Typer(help=...), so that
+# `ops --help` and `ops help-all` can be rendered without importing any tool.
+_SUBAPP_META: dict[str, str] = {
+    "constants": "Physical constants: search and list commonly used values.",
+    "units": "Unit conversion with simple dimensional analysis.",
+    "stats": "Basic statistics helpers.",
+    "waves": "Waveform generation and ASCII plotting.",
+    "notebook": "Simple lab notebook logging.",
+    "astro": "Astronomy helpers: sidereal time and coordinate transforms.",
+    "chem": "Chemistry helpers: molarity and dilution.",
+    "mech": "Classical mechanics tools: projectiles, work, energy, orbits.",
+    "relativity": "Relativity tools: time dilation, length contraction, energy.",
+    "bio": "Genetics & population biology tools.",
+    "data": "Quick data exploration for CSV/TSV files.",
+    "optics": "Geometric optics tools: Snell's law, thin lens, mirrors.",
+    "em": "Electromagnetism tools: Coulomb force and reactance helpers.",
+    "analysis": "Data analysis helpers: regression and uncertainty.",
+    "labcalc": "General lab calculations: dilutions, error, solution prep.",
+    "bioseq": "Bio sequence helpers with file support (FASTA/plain).",
+    "config": "View and modify Science Ops configuration.",
+}
+
+
+def _load_subapp(name: str) -> typer.Typer:
+    return importlib.import_module(_LAZY[name]).app
+
+
+class _LazyGroup(TyperGroup):
+    """Top-level group that imports tool modules on first lookup."""
+
+    _help_only = False
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        # Loaded sub-apps are also in self.commands; list each name once, in _LAZY order.
+        return [name for name in super().list_commands(ctx) if name not in _LAZY] + list(_LAZY)
+
+    def format_help(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        # The command listing only needs names and short help strings.
+        self._help_only = True
+        try:
+            super().format_help(ctx, formatter)
+        finally:
+            self._help_only = False
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        cmd = super().get_command(ctx, cmd_name)
+        if cmd is not None or cmd_name not in _LAZY:
+            return cmd
+        if self._help_only:
+            return TyperGroup(name=cmd_name, help=_SUBAPP_META[cmd_name])
+        group = typer.main.get_group(_load_subapp(cmd_name))
+        group.name = cmd_name
+        self.add_command(group, cmd_name)
+        return group
+
 
 app = typer.Typer(
-    help="Science Ops CLI — a terminal Swiss army knife for scientists and mathematicians."
+    cls=_LazyGroup,
+    help="Science Ops CLI — a terminal Swiss army knife for scientists and mathematicians.",
 )
-console = Console()
-_subapps: list[tuple[str, typer.Typer]] = []
 
 
 @app.callback()
@@ -43,39 +109,13 @@ def main(
         raise typer.Exit()
 
 
-def _register(subapp: typer.Typer, name: str) -> None:
-    app.add_typer(subapp, name=name)
-    _subapps.append((name, subapp))
-
-
-# Mount sub-apps
-_register(constants.app, "constants")
-_register(units.app, "units")
-_register(stats.app, "stats")
-_register(waves.app, "waves")
-_register(lab_notebook.app, "notebook")
-_register(astro.app, "astro")
-_register(chem.app, "chem")
-_register(mech.app, "mech")
-_register(relativity.app, "relativity")
-_register(bio.app, "bio")
-_register(data.app, "data")
-_register(optics.app, "optics")
-_register(em.app, "em")
-_register(analysis.app, "analysis")
-_register(labcalc.app, "labcalc")
-_register(bioseq.app, "bioseq")
-_register(config_cli.app, "config")
-
-
 @app.command("help-all")
 def help_all() -> None:
     """
     Show all subcommands and their short help strings.
     """
     console.print("[bold]Science Ops CLI command index[/bold]\n")
-    for name, sub in _subapps:
-        help_text = getattr(getattr(sub, "info", None), "help", "") or ""
+    for name, help_text in _SUBAPP_META.items():
         console.print(f"[cyan]{name}[/cyan]: {help_text}")
 
 
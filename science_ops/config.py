@@ -2,10 +2,16 @@ from __future__ import annotations
 
 import json
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+try:  # optional: faster parse/serialize when installed
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 DEFAULT_CONFIG_NAME = "science_ops_config.json"
 
 
@@ -14,32 +20,60 @@ class Config:
     notebook_path: Path
     default_body: Optional[str] = None
     color: bool = True
+    table_cache_mb: int = 256
 
     @classmethod
     def default(cls) -> "Config":
-        config_dir = Path(os.getenv("XDG_CONFIG_HOME", Path.home() / ".config")) / "science_ops"
-        config_dir.mkdir(parents=True, exist_ok=True)
+        config_dir = _config_dir()
         return cls(
             notebook_path=config_dir / "lab_notebook.md",
             default_body=None,
             color=True,
+            table_cache_mb=256,
         )
 
 
-def _config_file() -> Path:
-    config_dir = Path(os.getenv("XDG_CONFIG_HOME", Path.home() / ".config")) / "science_ops"
+@lru_cache(maxsize=8)
+def _config_dir_for(xdg_config_home: Optional[str]) -> Path:
+    # Keyed on the env value so a changed XDG_CONFIG_HOME is still honored;
+    # the mkdir syscall then runs once per directory per process.
+    base = Path(xdg_config_home) if xdg_config_home is not None else Path.home() / ".config"
+    config_dir = base / "science_ops"
     config_dir.mkdir(parents=True, exist_ok=True)
-    return config_dir / DEFAULT_CONFIG_NAME
+    return config_dir
 
 
-def load_config() -> Config:
-    cf = _config_file()
-    if not cf.exists():
+def _config_dir() -> Path:
+    return _config_dir_for(os.getenv("XDG_CONFIG_HOME"))
+
+
+def _config_file() -> Path:
+    return _config_dir() / DEFAULT_CONFIG_NAME
+
+
+def _loads(raw: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dumps(data: Dict[str, Any]) -> str:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(data, indent=2)
+
+
+@lru_cache(maxsize=4)
+def _load_cached(path_str: str, mtime_ns: int, size: int) -> Config:
+    # mtime_ns and size are part of the cache key only, so edits to the file
+    # invalidate it even on filesystems with coarse timestamps.
+    cf = Path(path_str)
+    if mtime_ns < 0:
         return Config.default()
 
     try:
-        data: Dict[str, Any] = json.loads(cf.read_text())
-    except json.JSONDecodeError:
+        data: Dict[str, Any] = _loads(cf.read_bytes())
+    except ValueError:  # json/orjson decode errors both subclass ValueError
         return Config.default()
 
     base = Config.default()
@@ -47,8 +81,27 @@ def load_config() -> Config:
     notebook_path = Path(data.get("notebook_path", base.notebook_path))
     default_body = data.get("default_body", base.default_body)
     color = bool(data.get("color", base.color))
+    table_cache_mb = data.get("table_cache_mb", base.table_cache_mb)
+    if isinstance(table_cache_mb, bool) or not isinstance(table_cache_mb, int) or table_cache_mb < 0:
+        table_cache_mb = base.table_cache_mb  # malformed value: keep the default
+
+    return Config(
+        notebook_path=notebook_path,
+        default_body=default_body,
+        color=color,
+        table_cache_mb=table_cache_mb,
+    )
 
-    return Config(notebook_path=notebook_path, default_body=default_body, color=color)
+
+def load_config() -> Config:
+    cf = _config_file()
+    try:
+        st = cf.stat()
+        mtime_ns, size = st.st_mtime_ns, st.st_size
+    except FileNotFoundError:
+        mtime_ns, size = -1, -1
+    # Hand out a copy: callers mutate the returned Config before saving it.
+    return replace(_load_cached(str(cf), mtime_ns, size))
 
 
 def save_config(config: Config) -> None:
@@ -57,5 +110,7 @@ def save_config(config: Config) -> None:
         "notebook_path": str(config.notebook_path),
         "default_body": config.default_body,
         "color": config.color,
+        "table_cache_mb": config.table_cache_mb,
     }
-    cf.write_text(json.dumps(data, indent=2))
+    cf.write_text(_dumps(data), encoding="utf-8")
+    _load_cached.cache_clear()
@@ -1,20 +1,40 @@
-# This makes it easy to import tools in cli.py
-from . import (
-    constants,
-    units,
-    stats,
-    waves,
-    lab_notebook,
-    astro,
-    chem,
-    mech,
-    relativity,
-    bio,
-    data,
-    optics,
-    em,
-    analysis,
-    labcalc,
-    bioseq,
-    config_cli,
-)  # noqa: F401
+# Tool modules are imported on first attribute access (PEP 562) so that
+# importing one tool does not drag in every sibling (and numpy) with it.
+from __future__ import annotations
+
+import importlib
+from types import ModuleType
+
+_NAMES = frozenset(
+    {
+        "constants",
+        "units",
+        "stats",
+        "waves",
+        "lab_notebook",
+        "astro",
+        "chem",
+        "mech",
+        "relativity",
+        "bio",
+        "data",
+        "optics",
+        "em",
+        "analysis",
+        "labcalc",
+        "bioseq",
+        "config_cli",
+    }
+)
+
+
+def __getattr__(name: str) -> ModuleType:
+    if name in _NAMES:
+        mod = importlib.import_module(f".{name}", __name__)
+        globals()[name] = mod
+        return mod
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(_NAMES)
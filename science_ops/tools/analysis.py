@@ -1,26 +1,49 @@
 from __future__ import annotations
 
-import csv
+import math
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import TYPE_CHECKING, List
 
-import numpy as np
 import typer
-from rich.console import Console
-from rich.table import Table
 
-from science_ops.tools.data import _load_table, _extract_numeric_pairs
+from science_ops.tools.data import _load_numeric, _numeric_pairs, _read_header
+from science_ops.ui import console
+from science_ops.utils.io import quiet_loadtxt
+
+if TYPE_CHECKING:
+    import numpy as np
 
 app = typer.Typer(help="Data analysis helpers: regression and uncertainty.")
-console = Console()
 
 
 def _regression_pairs(file: Path, xcol: str, ycol: str, delimiter: str | None) -> np.ndarray:
-    headers, rows = _load_table(file, delimiter=delimiter)
+    import numpy as np
+
+    headers, delimiter = _read_header(file, delimiter=delimiter)
     if xcol not in headers or ycol not in headers:
         console.print(f"[red]Columns not found. Available: {', '.join(headers)}[/red]")
         raise typer.Exit(code=1)
-    pts = _extract_numeric_pairs(rows, xcol, ycol)
+    xi, yi = headers.index(xcol), headers.index(ycol)
+
+    # Fast path: parse the two columns in C. Blank or non-numeric cells make
+    # loadtxt raise, in which case fall back to the row-skipping parser. The
+    # quotechar matters even for unused columns: usecols picks fields by
+    # position, so a quoted delimiter elsewhere in the row would shift them.
+    try:
+        pts = quiet_loadtxt(
+            file,
+            delimiter=delimiter,
+            skiprows=1,
+            usecols=(xi, yi),
+            dtype=np.float64,
+            quotechar='"',
+            comments=None,
+            ndmin=2,
+            encoding="utf-8",
+        )
+    except ValueError:
+        _, values = _load_numeric(file, delimiter=delimiter)
+        pts = _numeric_pairs(values, xi, yi)
     if pts.shape[0] < 2:
         console.print("[red]Need at least 2 numeric pairs for regression.[/red]")
         raise typer.Exit(code=1)
@@ -38,16 +61,31 @@ def regress(
     Simple linear regression y = m x + b.
     Prints slope m, intercept b, r, r^2.
     """
+    import numpy as np
+    from rich.table import Table
+
     pts = _regression_pairs(file, xcol, ycol, delimiter)
     x = pts[:, 0]
     y = pts[:, 1]
 
-    m, b = np.polyfit(x, y, 1)
-    y_pred = m * x + b
-    ss_res = float(np.sum((y - y_pred) ** 2))
-    ss_tot = float(np.sum((y - np.mean(y)) ** 2))
-    r2 = 1.0 - ss_res / ss_tot if ss_tot != 0 else 0.0
-    r = float(np.sqrt(r2)) if m >= 0 else -float(np.sqrt(r2))
+    # Closed-form least squares on mean-centred data: no Vandermonde matrix or
+    # residual arrays, and centring first keeps large offsets (timestamps)
+    # from cancelling out of the sums of squares.
+    mx = float(x.mean())
+    my = float(y.mean())
+    dx = x - mx
+    dy = y - my
+    sxx = float(np.dot(dx, dx))
+    sxy = float(np.dot(dx, dy))
+    syy = float(np.dot(dy, dy))
+
+    if sxx == 0:
+        console.print("[red]x values are all identical; slope is undefined.[/red]")
+        raise typer.Exit(code=1)
+    m = sxy / sxx
+    b = my - m * mx
+    r = sxy / math.sqrt(sxx * syy) if syy > 0 else 0.0
+    r2 = r * r
 
     table = Table(title=f"Linear regression: {ycol} vs {xcol}", header_style="bold cyan")
     table.add_column("Metric")
@@ -68,6 +106,8 @@ def uncertainty_combine(
 
         u_total = sqrt(u1^2 + u2^2 + ...)
     """
+    import numpy as np
+
     if not values:
         console.print("[red]Provide at least one uncertainty value.[/red]")
         raise typer.Exit(code=1)
@@ -1,14 +1,15 @@
 from __future__ import annotations
 
 import math
+import re
 from datetime import datetime, timezone
 from typing import Optional
 
 import typer
-from rich.console import Console
+
+from science_ops.ui import console
 
 app = typer.Typer(help="Astronomy helpers: sidereal time and coordinate transforms.")
-console = Console()
 
 
 def _parse_datetime(dt_str: Optional[str]) -> datetime:
@@ -30,77 +31,94 @@ def _parse_datetime(dt_str: Optional[str]) -> datetime:
     return dt.astimezone(timezone.utc)
 
 
+# sign, then up to three sexagesimal components with optional unit markers:
+# "10h12m45s", "10:12:45", "-12d30m00s", "+12°30'00\"", "12 30 00", "150.5".
+# Later components must follow whitespace or a marker, so "12.30.45" is
+# rejected rather than read as 12.30 and .45.
+_SEXAGESIMAL_RE = re.compile(
+    r"""^\s*([+-]?)\s*
+    (\d+(?:\.\d*)?|\.\d+)\s*(?:h|deg|d|°|:)?\s*
+    (?:(?<![\d.])(\d+(?:\.\d*)?|\.\d+)\s*(?:m|'|:)?\s*)?
+    (?:(?<![\d.])(\d+(?:\.\d*)?|\.\d+)\s*(?:s|")?\s*)?$""",
+    re.IGNORECASE | re.VERBOSE,
+)
+
+
+def _components(
+    text: str, markers: tuple[str, ...], error: str
+) -> tuple[float, float, float | None, float | None]:
+    """
+    Split text into (sign, first, minutes, seconds); minutes/seconds are None when absent.
+
+    The regex covers the usual notations; anything it rejects goes through
+    float() per component, so forms like "1e1" or "1.5e1h" still parse.
+    """
+    match = _SEXAGESIMAL_RE.match(text)
+    if match is not None:
+        sign, *parts = match.groups()
+        values = [None if p is None else float(p) for p in parts]
+    else:
+        stripped = text.strip()
+        sign = stripped[:1] if stripped[:1] in "+-" else ""
+        cleaned = stripped.lstrip("+-").lower()
+        for marker in markers:
+            cleaned = cleaned.replace(marker, " ")
+        try:
+            values = [float(p) for p in cleaned.split()]
+        except ValueError as exc:
+            raise typer.BadParameter(error) from exc
+        if not 1 <= len(values) <= 3:
+            raise typer.BadParameter(error)
+        values += [None] * (3 - len(values))
+    return (-1.0 if sign == "-" else 1.0), values[0], values[1], values[2]
+
+
+_RA_ERROR = "Invalid RA format. Try '10h12m45s' or '10:12:45'."
+_DEC_ERROR = "Invalid Dec format. Try '-12d30m00s' or '-12:30:00'."
+
+
 def _parse_ra(ra_str: str) -> float:
     """Parse right ascension string to degrees (default unit: hours)."""
     raw = ra_str.strip()
-    negative = raw.startswith("-")
-    text = raw.lower().replace(" ", "")
+    lowered = raw.lower()
 
     # Allow RA provided directly in degrees if explicitly marked
-    if "d" in text or "°" in text or "deg" in text:
+    if "d" in lowered or "°" in lowered:
         return _parse_dec(raw)
 
-    if negative:
-        text = text[1:]
-
-    if all(marker not in text for marker in ["h", "m", "s", ":"]):
-        try:
-            numeric = float(text)
-        except ValueError as exc:
-            raise typer.BadParameter("Invalid RA format. Try '10h12m45s' or '10:12:45'.") from exc
-        hours_value = numeric if numeric <= 24 else numeric / 15.0
-        hours_value *= -1 if negative else 1
-        return hours_value * 15.0
-
-    cleaned = text.replace("h", " ").replace("m", " ").replace("s", " ").replace(":", " ")
-    parts = [p for p in cleaned.split(" ") if p]
-    try:
-        hours = float(parts[0])
-        minutes = float(parts[1]) if len(parts) > 1 else 0.0
-        seconds = float(parts[2]) if len(parts) > 2 else 0.0
-    except (IndexError, ValueError) as exc:
-        raise typer.BadParameter("Invalid RA format. Try '10h12m45s' or '10:12:45'.") from exc
-
-    total_hours = hours + minutes / 60.0 + seconds / 3600.0
-    total_hours *= -1 if negative else 1
-    return total_hours * 15.0
+    sign, first, minutes, seconds = _components(raw, ("h", "m", "s", ":"), _RA_ERROR)
+    if minutes is None and not any(marker in lowered for marker in "hms:"):
+        # Bare number: hours if it fits in a day, otherwise degrees.
+        hours = first if first <= 24 else first / 15.0
+    else:
+        hours = first + (minutes or 0.0) / 60.0 + (seconds or 0.0) / 3600.0
+    return sign * hours * 15.0
 
 
 def _parse_dec(dec_str: str) -> float:
     """Parse declination to degrees."""
-    raw = dec_str.strip()
-    negative = raw.startswith("-")
-    text = raw.lstrip("+-").strip().lower()
-    text = text.replace("deg", "d").replace("°", "d")
-    text = text.replace(" ", "")
-    cleaned = text.replace("d", " ").replace("m", " ").replace("s", " ").replace(":", " ")
-    parts = [p for p in cleaned.split(" ") if p]
-
-    try:
-        deg = float(parts[0])
-        minutes = float(parts[1]) if len(parts) > 1 else 0.0
-        seconds = float(parts[2]) if len(parts) > 2 else 0.0
-    except (IndexError, ValueError) as exc:
-        raise typer.BadParameter("Invalid Dec format. Try '-12d30m00s' or '-12:30:00'.") from exc
-
-    total_deg = deg + minutes / 60.0 + seconds / 3600.0
-    return -total_deg if negative else total_deg
+    if "h" in dec_str.lower():
+        raise typer.BadParameter(_DEC_ERROR)
+    markers = ("deg", "d", "°", "m", "'", "s", '"', ":")
+    sign, deg, minutes, seconds = _components(dec_str, markers, _DEC_ERROR)
+    return sign * (deg + (minutes or 0.0) / 60.0 + (seconds or 0.0) / 3600.0)
 
 
 def _julian_date(dt: datetime) -> float:
     """Compute Julian Date from a timezone-aware datetime."""
     year = dt.year
     month = dt.month
-    day = dt.day + (dt.hour + dt.minute / 60 + dt.second / 3600 + dt.microsecond / 3.6e9) / 24
 
     if month <= 2:
         year -= 1
         month += 12
 
-    a = math.floor(year / 100)
-    b = 2 - a + math.floor(a / 4)
-    jd = math.floor(365.25 * (year + 4716)) + math.floor(30.6001 * (month + 1)) + day + b - 1524.5
-    return jd
+    # Integer day number (exact), plus the fraction of the day since noon.
+    a = year // 100
+    b = 2 - a + a // 4
+    jdn = (1461 * (year + 4716)) // 4 + (153 * (month + 1)) // 5 + dt.day + b - 1524
+    frac = (dt.hour * 3600 + dt.minute * 60 + dt.second + dt.microsecond * 1e-6) / 86400.0 - 0.5
+    return jdn + frac
 
 
 def _gmst(dt: datetime) -> float:
@@ -140,6 +158,34 @@ def ra_dec_to_altaz(ra_deg: float, dec_deg: float, lat_deg: float, lst_deg: floa
     return math.degrees(alt), az_deg
 
 
+def ra_dec_to_altaz_array(ra_deg, dec_deg, lat_deg, lst_deg):
+    """
+    Altitude and azimuth for arrays of RA/Dec targets and sidereal times.
+
+    Returns (alt_deg, az_deg) arrays; azimuth is 0 where the target is at the zenith/nadir.
+    """
+    import numpy as np
+
+    ra = np.deg2rad(np.asarray(ra_deg, dtype=float))
+    dec = np.deg2rad(np.asarray(dec_deg, dtype=float))
+    lat = np.deg2rad(np.asarray(lat_deg, dtype=float))
+    ha = np.deg2rad(np.asarray(lst_deg, dtype=float)) - ra
+
+    sin_dec, cos_dec = np.sin(dec), np.cos(dec)
+    sin_lat, cos_lat = np.sin(lat), np.cos(lat)
+
+    sin_alt = np.clip(sin_dec * sin_lat + cos_dec * cos_lat * np.cos(ha), -1.0, 1.0)
+    alt = np.arcsin(sin_alt)
+    cos_alt = np.cos(alt)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sin_az = -np.sin(ha) * cos_dec / cos_alt
+        cos_az = (sin_dec - sin_alt * sin_lat) / (cos_alt * cos_lat)
+        az = (np.rad2deg(np.arctan2(sin_az, cos_az)) + 360.0) % 360.0
+    az = np.where(np.abs(cos_alt) < 1e-10, 0.0, az)
+    return np.rad2deg(alt), az
+
+
 def _format_hours(deg_value: float) -> str:
     hours_total = (deg_value % 360.0) / 15.0
     h = int(hours_total)
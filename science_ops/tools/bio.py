@@ -1,15 +1,15 @@
 from __future__ import annotations
 
+import string
 from collections import Counter
 from typing import Dict, Tuple
 
 import typer
-from rich.console import Console
 
+from science_ops.ui import console
 from science_ops.utils.display import simple_table
 
 app = typer.Typer(help="Genetics & population biology tools.")
-console = Console()
 
 
 # --- Hardy–Weinberg ---------------------------------------------------------
@@ -119,17 +119,11 @@ def punnett(
         console.print(f"[red]{e}[/red]")
         raise typer.Exit(code=1)
 
-    gametes1 = [a1, a2]
-    gametes2 = [b1, b2]
-
-    offspring: Counter[str] = Counter()
-    total = 0
-
-    for g1 in gametes1:
-        for g2 in gametes2:
-            child = "".join(sorted([g1, g2]))  # sort so 'Aa' == 'aA'
-            offspring[child] += 1
-            total += 1
+    # Order each pair so 'Aa' == 'aA'; a comparison avoids a sorted() call per child.
+    offspring: Counter[str] = Counter(
+        x + y if x <= y else y + x for x in (a1, a2) for y in (b1, b2)
+    )
+    total = 4
 
     table = simple_table("Punnett square outcome", ["Genotype", "Probability"])
 
@@ -143,28 +137,56 @@ def punnett(
 # --- Sequence utilities -----------------------------------------------------
 
 
-CODON_TABLE: Dict[str, str] = {
-    # Standard genetic code (64 codons)
-    "TTT": "F", "TTC": "F", "TTA": "L", "TTG": "L",
-    "TCT": "S", "TCC": "S", "TCA": "S", "TCG": "S",
-    "TAT": "Y", "TAC": "Y", "TAA": "*", "TAG": "*",
-    "TGT": "C", "TGC": "C", "TGA": "*", "TGG": "W",
-    "CTT": "L", "CTC": "L", "CTA": "L", "CTG": "L",
-    "CCT": "P", "CCC": "P", "CCA": "P", "CCG": "P",
-    "CAT": "H", "CAC": "H", "CAA": "Q", "CAG": "Q",
-    "CGT": "R", "CGC": "R", "CGA": "R", "CGG": "R",
-    "ATT": "I", "ATC": "I", "ATA": "I", "ATG": "M",
-    "ACT": "T", "ACC": "T", "ACA": "T", "ACG": "T",
-    "AAT": "N", "AAC": "N", "AAA": "K", "AAG": "K",
-    "AGT": "S", "AGC": "S", "AGA": "R", "AGG": "R",
-    "GTT": "V", "GTC": "V", "GTA": "V", "GTG": "V",
-    "GCT": "A", "GCC": "A", "GCA": "A", "GCG": "A",
-    "GAT": "D", "GAC": "D", "GAA": "E", "GAG": "E",
-    "GGT": "G", "GGC": "G", "GGA": "G", "GGG": "G",
-}
-
-START_CODONS = {"ATG"}
-STOP_CODONS = {"TAA", "TAG", "TGA"}
+# Standard genetic code (64 codons) as one amino acid byte per codon index
+# (b0 << 4) | (b1 << 2) | b2 with bases encoded A=0, C=1, G=2, T=3.
+_BASES = "ACGT"
+_AA_BY_IDX = b"KNKNTTTTRSRSIIMIQHQHPPPPRRRRLLLLEDEDAAAAGGGGVVVV*Y*YSSSS*CWCLFLF"
+
+
+def __getattr__(name: str) -> Dict[str, str]:
+    # CODON_TABLE is only materialized for callers that actually want the dict.
+    if name == "CODON_TABLE":
+        table = {
+            b0 + b1 + b2: chr(_AA_BY_IDX[(i << 4) | (j << 2) | k])
+            for i, b0 in enumerate(_BASES)
+            for j, b1 in enumerate(_BASES)
+            for k, b2 in enumerate(_BASES)
+        }
+        globals()["CODON_TABLE"] = table
+        return table
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Uppercase ASCII letters and drop whitespace in a single pass.
+_CLEAN_TR = str.maketrans(string.ascii_lowercase, string.ascii_uppercase, " \t\r\n")
+
+# Every byte except A/C/G/T, for deleting invalid characters in one pass.
+_NON_ACGT = bytes(i for i in range(256) if chr(i) not in _BASES)
+
+# Map bases to their 2-bit code; anything else maps to 4 so that a codon
+# containing it can be flagged with a single bit test.
+_BASE_TR = bytes(_BASES.find(chr(i)) if chr(i) in _BASES else 4 for i in range(256))
+
+
+def _translate_codons(seq: str, start: int = 0) -> str:
+    """
+    Translate every complete codon of seq from start, vectorized via a lookup table.
+
+    Stop codons are kept as '*' and codons with non-ACGT bases become 'X';
+    callers decide where to cut.
+    """
+    import numpy as np
+
+    n_codons = max(0, (len(seq) - start) // 3)
+    if n_codons == 0:
+        return ""
+    end = start + 3 * n_codons
+    codes = np.frombuffer(seq[start:end].encode("ascii", "replace").translate(_BASE_TR), dtype=np.uint8)
+    b0, b1, b2 = codes[0::3], codes[1::3], codes[2::3]
+    idx = ((b0 & 3) << 4) | ((b1 & 3) << 2) | (b2 & 3)
+    aa = np.frombuffer(_AA_BY_IDX, dtype=np.uint8)[idx]
+    aa[((b0 | b1 | b2) & 4) != 0] = ord("X")
+    return aa.tobytes().decode("ascii")
 
 
 @app.command("gc-content")
@@ -172,22 +194,23 @@ def gc_content(
     sequence: str = typer.Argument(..., help="DNA sequence (A/C/G/T)."),
 ) -> None:
     """Compute GC content (fraction of G or C bases) of a DNA sequence."""
-    seq = sequence.upper().replace(" ", "")
+    seq = sequence.translate(_CLEAN_TR)
     if not seq:
         console.print("[red]Empty sequence.[/red]")
         raise typer.Exit(code=1)
 
-    valid = set("ACGT")
-    invalid = set(seq) - valid
-    if invalid:
+    cleaned = seq.encode("ascii", "ignore").translate(None, _NON_ACGT)
+    if len(cleaned) != len(seq):
+        # Unhappy path only: work out which characters were dropped.
+        invalid = set(seq).difference(_BASES)
         console.print(f"[yellow]Warning: ignoring invalid characters: {''.join(sorted(invalid))}[/yellow]")
-        seq = "".join(ch for ch in seq if ch in valid)
+        seq = cleaned.decode("ascii")
         if not seq:
             console.print("[red]No valid bases left after filtering.[/red]")
             raise typer.Exit(code=1)
 
     total = len(seq)
-    gc = sum(1 for b in seq if b in ("G", "C"))
+    gc = seq.count("G") + seq.count("C")
     frac = gc / total
 
     console.print(f"Length = {total}")
@@ -217,7 +240,7 @@ def translate_dna(
 
     Any incomplete codon at the end is ignored.
     """
-    seq = sequence.upper().replace(" ", "").replace("\n", "")
+    seq = sequence.translate(_CLEAN_TR)
     if not seq:
         console.print("[red]Empty sequence.[/red]")
         raise typer.Exit(code=1)
@@ -234,15 +257,11 @@ def translate_dna(
             raise typer.Exit(code=1)
         start_index = idx
 
-    protein = []
-    for i in range(start_index, len(seq) - 2, 3):
-        codon = seq[i:i+3]
-        aa = CODON_TABLE.get(codon, "X")  # X = unknown/invalid
-        if aa == "*" and stop_at_stop:
-            break
-        protein.append(aa)
-
-    prot_str = "".join(protein)
+    prot_str = _translate_codons(seq, start_index)  # X = unknown/invalid
+    if stop_at_stop:
+        stop = prot_str.find("*")
+        if stop != -1:
+            prot_str = prot_str[:stop]
     console.print(f"Protein: [bold]{prot_str}[/bold]")
 
 
@@ -263,16 +282,17 @@ def find_orfs(
     - Frames numbered 1,2,3 correspond to offsets 0,1,2.
     - ORFs start at ATG and end at the first in-frame stop (or continue if --read-through).
     """
-    seq = sequence.upper().replace(" ", "").replace("\n", "")
+    seq = sequence.translate(_CLEAN_TR)
     if not seq:
         console.print("[red]Empty sequence.[/red]")
         raise typer.Exit(code=1)
 
-    valid = set("ACGT")
-    invalid = set(seq) - valid
-    if invalid:
+    cleaned = seq.encode("ascii", "ignore").translate(None, _NON_ACGT)
+    if len(cleaned) != len(seq):
+        # Unhappy path only: work out which characters were dropped.
+        invalid = set(seq).difference(_BASES)
         console.print(f"[yellow]Warning: ignoring invalid characters: {''.join(sorted(invalid))}[/yellow]")
-        seq = "".join(ch for ch in seq if ch in valid)
+        seq = cleaned.decode("ascii")
         if not seq:
             console.print("[red]No valid bases left after filtering.[/red]")
             raise typer.Exit(code=1)
@@ -290,30 +310,22 @@ def find_orfs(
 
     for frame in frame_list:
         offset = frame - 1
-        i = offset
-        while i <= len(seq) - 3:
-            codon = seq[i:i+3]
-            if codon in START_CODONS:
-                j = i
-                aa_seq = []
-                while j <= len(seq) - 3:
-                    c = seq[j:j+3]
-                    aa = CODON_TABLE.get(c, "X")
-                    if c in STOP_CODONS:
-                        if stop_at_stop:
-                            break
-                        aa_seq.append("*")
-                    else:
-                        aa_seq.append(aa)
-                    j += 3
-                aa_str = "".join(aa_seq)
-                if len(aa_str) >= min_aa:
-                    start_nt = i + 1  # 1-based inclusive
-                    end_nt = j if stop_at_stop else min(len(seq), j)
-                    orfs.append((frame, start_nt, end_nt, aa_str))
-                i += 3
+        # Translate the frame once; an in-frame ATG is exactly an 'M' in the
+        # protein, so both starts and stops are found with C-level str.find.
+        prot = _translate_codons(seq, offset)
+        k = prot.find("M")
+        while k != -1:
+            if stop_at_stop:
+                stop = prot.find("*", k)
+                aa_str = prot[k:] if stop == -1 else prot[k:stop]
             else:
-                i += 3
+                aa_str = prot[k:]
+            if len(aa_str) >= min_aa:
+                start = offset + 3 * k
+                start_nt = start + 1  # 1-based inclusive
+                end_nt = start + 3 * len(aa_str)
+                orfs.append((frame, start_nt, end_nt, aa_str))
+            k = prot.find("M", k + 1)
 
     if not orfs:
         console.print(f"[yellow]No ORFs found with length >= {min_aa} aa in frames {frame_list}.[/yellow]")
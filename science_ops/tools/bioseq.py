@@ -1,49 +1,46 @@
 from __future__ import annotations
 
+import string
 from pathlib import Path
 
 import typer
-from rich.console import Console
 
-from science_ops.tools.bio import CODON_TABLE, STOP_CODONS
+from science_ops.tools.bio import _CLEAN_TR, _translate_codons
+from science_ops.ui import console
 
 app = typer.Typer(help="Bio sequence helpers with file support (FASTA/plain).")
-console = Console()
+
+_CLEAN_BYTES_TR = bytes.maketrans(string.ascii_lowercase.encode(), string.ascii_uppercase.encode())
 
 
 def _read_sequence_from_file(path: Path) -> str:
     if not path.exists():
         raise FileNotFoundError(f"File not found: {path}")
-    lines = path.read_text(encoding="utf-8", errors="ignore").splitlines()
-    seq_parts = []
-    for line in lines:
-        if line.startswith(">"):
-            continue
-        seq_parts.append(line.strip())
-    seq = "".join(seq_parts).upper().replace(" ", "")
-    return seq
+    # Stream lines in binary so large FASTA files are never held twice.
+    buf = bytearray()
+    with path.open("rb") as f:
+        for line in f:
+            if line[:1] == b">":
+                continue
+            buf += line.translate(_CLEAN_BYTES_TR, b" \t\r\n")
+    return buf.decode("utf-8", errors="ignore")
 
 
 def _gc_content(seq: str) -> float:
     if not seq:
         return 0.0
-    valid = [b for b in seq if b in ("A", "C", "G", "T")]
-    if not valid:
+    gc = seq.count("G") + seq.count("C")
+    n_valid = gc + seq.count("A") + seq.count("T")
+    if not n_valid:
         return 0.0
-    gc = sum(1 for b in valid if b in ("G", "C"))
-    return gc / len(valid)
+    return gc / n_valid
 
 
 def _translate(seq: str, frame: int = 0) -> str:
-    seq = seq.upper().replace(" ", "")
-    protein = []
-    for i in range(frame, len(seq) - 2, 3):
-        codon = seq[i : i + 3]
-        aa = CODON_TABLE.get(codon, "X")
-        if aa in STOP_CODONS:
-            break
-        protein.append(aa)
-    return "".join(protein)
+    seq = seq.translate(_CLEAN_TR)
+    protein = _translate_codons(seq, frame)
+    stop = protein.find("*")
+    return protein if stop == -1 else protein[:stop]
 
 
 @app.command("gc-file")
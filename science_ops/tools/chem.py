@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+from pathlib import Path
+
 import typer
-from rich.console import Console
+
+from science_ops.ui import console, emit_numeric_rows
+from science_ops.utils.io import read_numeric_rows
 
 app = typer.Typer(help="Chemistry helpers: molarity and dilution.")
-console = Console()
 
 
 def calculate_molarity(moles: float, volume_l: float) -> float:
@@ -14,7 +17,7 @@ def calculate_molarity(moles: float, volume_l: float) -> float:
 
 
 def calculate_dilution_final_volume(c1: float, v1_ml: float, c2: float) -> float:
-    if any(v <= 0 for v in [c1, v1_ml, c2]):
+    if c1 <= 0 or v1_ml <= 0 or c2 <= 0:
         raise ValueError("Concentrations and volume must be positive.")
     if c2 >= c1:
         raise ValueError("Target concentration must be lower than the stock for dilution.")
@@ -53,3 +56,56 @@ def dilute(
     console.print(f"Final volume: [bold]{v2:.3f} mL[/bold]")
     console.print(f"Add solvent : [bold]{solvent:.3f} mL[/bold]")
     console.print("(Assuming ideal mixing; adjust for density/temperature if needed.)")
+
+
+@app.command("molarity-batch")
+def molarity_batch(
+    file: Path = typer.Argument(..., exists=True, readable=True, help="CSV/TSV of moles,volume_l rows."),
+    output: Path | None = typer.Option(None, "--output", "-o", help="Write results to this CSV instead of stdout."),
+) -> None:
+    """Compute molarity for every row of a moles,volume_l file in one pass."""
+    import numpy as np
+
+    try:
+        rows = read_numeric_rows(file, 2)
+    except ValueError as exc:
+        console.print(f"[red]{exc}[/red]")
+        raise typer.Exit(code=1) from exc
+
+    moles, volume_l = rows[:, 0], rows[:, 1]
+    bad = np.flatnonzero(volume_l <= 0)
+    if bad.size:
+        console.print(f"[red]Volume must be positive (data row {bad[0] + 1}).[/red]")
+        raise typer.Exit(code=1)
+
+    emit_numeric_rows(["moles", "volume_l", "molarity_M"], np.column_stack((moles, volume_l, moles / volume_l)), output)
+
+
+@app.command("dilute-batch")
+def dilute_batch(
+    file: Path = typer.Argument(..., exists=True, readable=True, help="CSV/TSV of c1,v1_ml,c2 rows."),
+    output: Path | None = typer.Option(None, "--output", "-o", help="Write results to this CSV instead of stdout."),
+) -> None:
+    """Dilution (C1 * V1 = C2 * V2) for every row of a c1,v1_ml,c2 file in one pass."""
+    import numpy as np
+
+    try:
+        rows = read_numeric_rows(file, 3)
+    except ValueError as exc:
+        console.print(f"[red]{exc}[/red]")
+        raise typer.Exit(code=1) from exc
+
+    c1, v1, c2 = rows[:, 0], rows[:, 1], rows[:, 2]
+    bad = np.flatnonzero((rows <= 0).any(axis=1))
+    if bad.size:
+        console.print(f"[red]Concentrations and volume must be positive (data row {bad[0] + 1}).[/red]")
+        raise typer.Exit(code=1)
+    bad = np.flatnonzero(c2 >= c1)
+    if bad.size:
+        console.print(
+            f"[red]Target concentration must be lower than the stock for dilution (data row {bad[0] + 1}).[/red]"
+        )
+        raise typer.Exit(code=1)
+
+    v2 = c1 * v1 / c2
+    emit_numeric_rows(["c1", "v1_ml", "c2", "v2_ml", "solvent_ml"], np.column_stack((c1, v1, c2, v2, v2 - v1)), output)
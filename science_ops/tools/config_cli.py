@@ -3,13 +3,12 @@ from __future__ import annotations
 from pathlib import Path
 
 import typer
-from rich.console import Console
 from rich.table import Table
 
 from science_ops.config import load_config, save_config
+from science_ops.ui import console
 
 app = typer.Typer(help="View and modify Science Ops configuration.")
-console = Console()
 
 
 @app.command("show")
@@ -23,13 +22,14 @@ def show_config() -> None:
     table.add_row("notebook_path", str(cfg.notebook_path))
     table.add_row("default_body", str(cfg.default_body))
     table.add_row("color", str(cfg.color))
+    table.add_row("table_cache_mb", str(cfg.table_cache_mb))
 
     console.print(table)
 
 
 @app.command("set")
 def set_config(
-    key: str = typer.Argument(..., help="Config key: notebook_path, default_body, color"),
+    key: str = typer.Argument(..., help="Config key: notebook_path, default_body, color, table_cache_mb"),
     value: str = typer.Argument(..., help="New value."),
 ) -> None:
     """Set a configuration value."""
@@ -47,8 +47,17 @@ def set_config(
         else:
             console.print("[red]color must be one of: true/false, yes/no, on/off, 1/0.[/red]")
             raise typer.Exit(code=1)
+    elif key == "table_cache_mb":
+        try:
+            table_cache_mb = int(value)
+        except ValueError:
+            table_cache_mb = -1
+        if table_cache_mb < 0:
+            console.print("[red]table_cache_mb must be a non-negative integer (0 disables the cache).[/red]")
+            raise typer.Exit(code=1)
+        cfg.table_cache_mb = table_cache_mb
     else:
-        console.print("[red]Unknown config key. Use: notebook_path, default_body, color.[/red]")
+        console.print("[red]Unknown config key. Use: notebook_path, default_body, color, table_cache_mb.[/red]")
         raise typer.Exit(code=1)
 
     save_config(cfg)
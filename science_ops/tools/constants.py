@@ -1,12 +1,13 @@
 from __future__ import annotations
 
+import unicodedata
+
 import typer
 from rich.table import Table
-from rich.console import Console
 
-app = typer.Typer(help="Physical constants: search and list commonly used values.")
+from science_ops.ui import console
 
-console = Console()
+app = typer.Typer(help="Physical constants: search and list commonly used values.")
 
 # Very small starter set — you can expand this later or pull from a JSON file.
 CONSTANTS = {
@@ -41,6 +42,15 @@ CONSTANTS = {
 }
 
 
+def _fold(text: str) -> str:
+    """Lowercase and strip diacritics so 'Böltzmann' matches 'boltzmann'."""
+    return unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii").lower()
+
+
+# (key, constant, folded name, folded symbol), built once for fuzzy lookup.
+_NORMALIZED = [(key, c, _fold(c["name"]), _fold(c["symbol"])) for key, c in CONSTANTS.items()]
+
+
 @app.command("list")
 def list_constants() -> None:
     """List available constants."""
@@ -68,7 +78,7 @@ def list_constants() -> None:
 @app.command("get")
 def get_constant(query: str = typer.Argument(..., help="Key or name fragment.")) -> None:
     """Get information about a constant by key or fuzzy name match."""
-    query_lower = query.lower()
+    query_lower = _fold(query) or query.lower()
 
     # Exact key first
     if query_lower in CONSTANTS:
@@ -82,8 +92,8 @@ def get_constant(query: str = typer.Argument(..., help="Key or name fragment."))
     # Fuzzy match by name or symbol
     matches = {
         key: c
-        for key, c in CONSTANTS.items()
-        if query_lower in c["name"].lower() or query_lower in c["symbol"].lower()
+        for key, c, name, symbol in _NORMALIZED
+        if query_lower in name or query_lower in symbol
     }
 
     if not matches:
@@ -1,65 +1,280 @@
 from __future__ import annotations
 
 import csv
+import hashlib
+import itertools
+import math
+import os
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import TYPE_CHECKING, Iterator, List, Sequence, Tuple
 
-import numpy as np
 import typer
-from rich.console import Console
 from rich.table import Table
 
-from science_ops.utils.math_helpers import describe
+from science_ops.config import load_config
+from science_ops.ui import console
+from science_ops.utils.io import quiet_loadtxt, sniff_delimiter
+
+if TYPE_CHECKING:
+    import numpy as np
 
 app = typer.Typer(help="Quick data exploration for CSV/TSV files.")
-console = Console()
 
 
-def _load_table(path: Path, delimiter: str | None = None) -> Tuple[List[str], List[Dict[str, str]]]:
+def _read_header(path: Path, delimiter: str | None = None) -> Tuple[List[str], str]:
+    """Read only the header line, guessing the delimiter from it when not given."""
+    with path.open("r", encoding="utf-8", errors="ignore", newline="") as f:
+        first = f.readline()
+    if delimiter is None:
+        delimiter = sniff_delimiter(first)
+    headers = next(csv.reader([first], delimiter=delimiter), [])
+    return headers, delimiter
+
+
+_CHUNK_ROWS = 65_536
+
+
+def _parse_chunk(lines: List[str], delimiter: str, n_cols: int, multiline: bool = False) -> np.ndarray:
+    """
+    Parse a block of data lines into a (rows, n_cols) array of cell strings.
+
+    multiline marks a block in which a quoted field spans physical lines;
+    np.loadtxt treats each line as a record, so such blocks go straight to
+    the csv reader.
+    """
+    import numpy as np
+
+    try:
+        if multiline:
+            raise ValueError("quoted field spans lines")
+        cells = quiet_loadtxt(
+            lines,
+            dtype=str,
+            delimiter=delimiter,
+            quotechar='"',
+            comments=None,
+            ndmin=2,
+        )
+        if cells.shape[0] == 0 or cells.shape[1] == n_cols:
+            return cells.reshape(cells.shape[0], n_cols)
+    except ValueError:
+        pass
+    # Forgiving fallback for ragged rows: pad/trim each row to the header
+    # width and skip blank lines, as csv.DictReader did.
+    rows = [(r + [""] * n_cols)[:n_cols] for r in csv.reader(lines, delimiter=delimiter) if r]
+    return np.array(rows, dtype=str).reshape(len(rows), n_cols)
+
+
+def _iter_line_blocks(path: Path, chunk_rows: int) -> Iterator[Tuple[List[str], bool]]:
+    """
+    Yield (lines, multiline) blocks of chunk_rows data lines each.
+
+    A block is extended rather than ended inside a quoted field; multiline
+    is True when some record in it spans physical lines.
+    """
+    with path.open("r", encoding="utf-8", errors="ignore", newline="") as f:
+        f.readline()  # header
+        while True:
+            lines = list(itertools.islice(f, chunk_rows))
+            if not lines:
+                return
+            # An odd number of quotes on a line means a quoted field runs onto
+            # the next one; keep reading until the last record is closed.
+            open_quotes = [line.count('"') % 2 for line in lines]
+            multiline = any(open_quotes)
+            unclosed = sum(open_quotes) % 2
+            while unclosed:
+                line = f.readline()
+                if not line:
+                    break
+                lines.append(line)
+                unclosed ^= line.count('"') % 2
+            yield lines, multiline
+
+
+def _iter_chunks(path: Path, delimiter: str, n_cols: int, chunk_rows: int) -> Iterator[np.ndarray]:
+    for lines, multiline in _iter_line_blocks(path, chunk_rows):
+        yield _parse_chunk(lines, delimiter, n_cols, multiline)
+
+
+def _load_table(
+    path: Path, delimiter: str | None = None, chunk_rows: int = _CHUNK_ROWS
+) -> Tuple[List[str], Iterator[np.ndarray]]:
+    """
+    Open a CSV/TSV file as its headers plus a lazy stream of cell blocks.
+
+    Each block is a 2-D array of cell strings of at most chunk_rows rows,
+    parsed by NumPy's C reader, so memory stays bounded by the block size.
+    """
     if not path.exists():
         raise FileNotFoundError(f"File not found: {path}")
 
-    # Guess delimiter: default comma, fallback to tab if no commas
-    text = path.read_text(encoding="utf-8", errors="ignore")
-    if delimiter is None:
-        delimiter = "\t" if ("," not in text and "\t" in text) else ","
-
-    reader = csv.DictReader(text.splitlines(), delimiter=delimiter)
-    rows = list(reader)
-    if not rows:
-        raise ValueError("File appears to be empty or has no data rows.")
-    headers = reader.fieldnames or []
-    return headers, rows
-
-
-def _extract_numeric_column(rows: List[Dict[str, str]], col: str) -> np.ndarray:
-    values: List[float] = []
-    for r in rows:
-        raw = r.get(col, "").strip()
-        if raw == "":
-            continue
-        try:
-            values.append(float(raw))
-        except ValueError:
-            # Non-numeric entries are skipped
-            continue
-    return np.array(values, dtype=float)
-
-
-def _extract_numeric_pairs(rows: List[Dict[str, str]], xcol: str, ycol: str) -> np.ndarray:
-    pairs: List[Tuple[float, float]] = []
-    for r in rows:
-        x_raw = r.get(xcol, "").strip()
-        y_raw = r.get(ycol, "").strip()
-        if x_raw == "" or y_raw == "":
-            continue
+    headers, delimiter = _read_header(path, delimiter)
+    return headers, _iter_chunks(path, delimiter, len(headers), chunk_rows)
+
+
+def _to_float(cells: Sequence[str]) -> np.ndarray:
+    """Convert a column of cell strings to floats, NaN where blank or non-numeric."""
+    import numpy as np
+
+    try:
+        return np.fromiter(map(float, cells), dtype=np.float64, count=len(cells))
+    except ValueError:
+        pass
+    # Blanks or text: convert each distinct string once rather than every cell.
+    parsed: dict[str, float] = {}
+    out = np.empty(len(cells), dtype=np.float64)
+    for i, raw in enumerate(cells):
+        value = parsed.get(raw)
+        if value is None:
+            try:
+                value = float(raw)
+            except ValueError:
+                value = math.nan
+            parsed[raw] = value
+        out[i] = value
+    return out
+
+
+def _parse_numeric_block(lines: List[str], delimiter: str, n_cols: int, multiline: bool) -> np.ndarray:
+    """
+    Parse a block of data lines straight to a (rows, n_cols) float matrix.
+
+    All-numeric blocks are read by np.loadtxt as float64. Anything else goes
+    through csv.reader one column at a time, so a long text cell costs its
+    own length rather than widening a fixed-width string matrix.
+    """
+    import numpy as np
+
+    if not multiline:
         try:
-            x_val = float(x_raw)
-            y_val = float(y_raw)
+            values = quiet_loadtxt(
+                lines,
+                dtype=np.float64,
+                delimiter=delimiter,
+                quotechar='"',
+                comments=None,
+                ndmin=2,
+            )
+            if values.shape[0] == 0 or values.shape[1] == n_cols:
+                return values.reshape(values.shape[0], n_cols)
         except ValueError:
-            continue
-        pairs.append((x_val, y_val))
-    return np.array(pairs, dtype=float)
+            pass
+    rows = [r for r in csv.reader(lines, delimiter=delimiter) if r]
+    values = np.empty((len(rows), n_cols), dtype=np.float64)
+    for i in range(n_cols):
+        values[:, i] = _to_float([r[i] if i < len(r) else "" for r in rows])
+    return values
+
+
+def _parse_numeric(path: Path, delimiter: str, n_cols: int) -> np.ndarray:
+    import numpy as np
+
+    blocks = [
+        _parse_numeric_block(lines, delimiter, n_cols, multiline)
+        for lines, multiline in _iter_line_blocks(path, _CHUNK_ROWS)
+    ]
+    return np.concatenate(blocks) if blocks else np.empty((0, n_cols))
+
+
+def _table_cache_dir() -> Path:
+    return Path(os.getenv("XDG_CACHE_HOME", Path.home() / ".cache")) / "science_ops" / "tables"
+
+
+def _evict_table_cache(cache_dir: Path, max_bytes: int) -> None:
+    # Least recently used first: cache hits refresh the file's mtime.
+    entries = sorted(((p.stat(), p) for p in cache_dir.glob("*.npy")), key=lambda e: e[0].st_mtime_ns)
+    total = sum(st.st_size for st, _ in entries)
+    for st, p in entries:
+        if total <= max_bytes:
+            break
+        p.unlink(missing_ok=True)
+        total -= st.st_size
+
+
+def _load_numeric(path: Path, delimiter: str | None = None) -> Tuple[List[str], np.ndarray]:
+    """
+    Load a CSV/TSV file as its headers and a (rows, columns) float matrix.
+
+    Blank or non-numeric cells are NaN. The parsed matrix is cached on disk,
+    keyed by path, mtime, size and delimiter, so repeated commands on an
+    unchanged file skip parsing; set table_cache_mb to 0 to disable.
+    """
+    import numpy as np
+
+    if not path.exists():
+        raise FileNotFoundError(f"File not found: {path}")
+
+    headers, delimiter = _read_header(path, delimiter)
+    max_bytes = load_config().table_cache_mb * 1024 * 1024
+    if max_bytes <= 0:
+        return headers, _parse_numeric(path, delimiter, len(headers))
+
+    st = path.stat()
+    key = repr((str(path.resolve()), st.st_mtime_ns, st.st_size, delimiter))
+    cache_dir = _table_cache_dir()
+    cache_path = cache_dir / f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}.npy"
+    try:
+        values = np.load(cache_path)
+        if values.ndim == 2 and values.shape[1] == len(headers):
+            os.utime(cache_path)
+            return headers, values
+    except (OSError, ValueError):
+        pass
+
+    values = _parse_numeric(path, delimiter, len(headers))
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(".tmp")
+        with tmp_path.open("wb") as f:
+            np.save(f, values)
+        os.replace(tmp_path, cache_path)
+        _evict_table_cache(cache_dir, max_bytes)
+    except OSError:
+        pass  # caching is best effort
+    return headers, values
+
+
+def _numeric_column(values: np.ndarray, col: int) -> np.ndarray:
+    import numpy as np
+
+    data = values[:, col]
+    return data[~np.isnan(data)]
+
+
+def _numeric_pairs(values: np.ndarray, xi: int, yi: int) -> np.ndarray:
+    """Rows where both columns xi and yi are numeric, as an (N, 2) array."""
+    import numpy as np
+
+    pts = values[:, [xi, yi]]
+    return pts[~np.isnan(pts).any(axis=1)]
+
+
+def _describe_columns(values: np.ndarray) -> Tuple[np.ndarray, Tuple[np.ndarray, ...]]:
+    """
+    NaN-aware count/mean/std/min/max/median for every column at once.
+
+    Returns the indices of columns with at least one numeric value and a
+    tuple of per-column statistic arrays for those columns, matching
+    describe() (sample std, 0.0 for a single value).
+    """
+    import numpy as np
+
+    mask = ~np.isnan(values)
+    counts = mask.sum(axis=0)
+    cols = np.flatnonzero(counts)
+    if cols.size == 0:
+        return cols, ()
+    data, mask, counts = values[:, cols], mask[:, cols], counts[cols]
+
+    # inf cells give inf - inf = NaN statistics, as describe() does; skip the warnings.
+    with np.errstate(invalid="ignore", over="ignore"):
+        mean = np.where(mask, data, 0.0).sum(axis=0) / counts
+        dev = np.where(mask, data - mean, 0.0)
+        var = (dev * dev).sum(axis=0) / np.maximum(counts - 1, 1)
+        std = np.where(counts > 1, np.sqrt(var), 0.0)
+    stats = (counts, mean, std, np.nanmin(data, axis=0), np.nanmax(data, axis=0), np.nanmedian(data, axis=0))
+    return cols, stats
 
 
 @app.command("summarize")
@@ -70,7 +285,7 @@ def summarize(
     """
     Compute descriptive statistics for each numeric column in a CSV/TSV file.
     """
-    headers, rows = _load_table(file, delimiter=delimiter)
+    headers, values = _load_numeric(file, delimiter=delimiter)
 
     table = Table(title=f"Summary: {file}", header_style="bold cyan")
     table.add_column("Column")
@@ -81,28 +296,22 @@ def summarize(
     table.add_column("Max")
     table.add_column("Median")
 
-    any_numeric = False
+    cols, stats = _describe_columns(values)
+    if cols.size == 0:
+        console.print("[yellow]No numeric columns detected.[/yellow]")
+        return
 
-    for col in headers:
-        data = _extract_numeric_column(rows, col)
-        if data.size == 0:
-            continue
-        any_numeric = True
-        stats = describe(data)
+    for i, count, mean, std, lo, hi, median in zip(cols.tolist(), *(s.tolist() for s in stats)):
         table.add_row(
-            col,
-            str(stats["count"]),
-            f"{stats['mean']:.6g}",
-            f"{stats['std']:.6g}",
-            f"{stats['min']:.6g}",
-            f"{stats['max']:.6g}",
-            f"{stats['median']:.6g}",
+            headers[i],
+            str(count),
+            f"{mean:.6g}",
+            f"{std:.6g}",
+            f"{lo:.6g}",
+            f"{hi:.6g}",
+            f"{median:.6g}",
         )
 
-    if not any_numeric:
-        console.print("[yellow]No numeric columns detected.[/yellow]")
-        return
-
     console.print(table)
 
 
@@ -115,15 +324,20 @@ def head(
     """
     Display the first N rows of a CSV/TSV file.
     """
-    headers, data_rows = _load_table(file, delimiter=delimiter)
+    import numpy as np
+
     rows = max(1, rows)
+    # Only the first block is parsed, so this reads just `rows` lines.
+    headers, chunks = _load_table(file, delimiter=delimiter, chunk_rows=rows)
+    cells = next(chunks, np.empty((0, len(headers)), dtype=str))
+    chunks.close()
 
     table = Table(title=f"Head: {file}", header_style="bold cyan", show_lines=False)
     for h in headers:
         table.add_column(h)
 
-    for r in data_rows[:rows]:
-        table.add_row(*(r.get(h, "") for h in headers))
+    for r in cells:
+        table.add_row(*r)
 
     console.print(table)
 
@@ -139,24 +353,32 @@ def hist(
     """
     ASCII histogram of a numeric column in a CSV/TSV file.
     """
-    headers, rows = _load_table(file, delimiter=delimiter)
+    import numpy as np
+
+    headers, values = _load_numeric(file, delimiter=delimiter)
     if column not in headers:
         console.print(f"[red]Column '{column}' not found. Available: {', '.join(headers)}[/red]")
         raise typer.Exit(code=1)
 
-    data = _extract_numeric_column(rows, column)
+    data = _numeric_column(values, headers.index(column))
     if data.size == 0:
         console.print(f"[yellow]Column '{column}' has no numeric data.[/yellow]")
         raise typer.Exit(code=1)
 
     hist, edges = np.histogram(data, bins=bins)
-    max_count = max(hist) if hist.size else 1
-
+    max_count = int(hist.max()) if hist.size else 0
+    if max_count > 0:
+        bar_lens = (hist.astype(np.float64) / max_count * width).astype(np.int64)
+    else:
+        bar_lens = np.zeros_like(hist)
+
+    # Render every bar into one block: a single console.print instead of one per bin.
+    block = "\n".join(
+        f"{left: .4g} – {right: .4g} | {'*' * n} ({count})"
+        for count, n, left, right in zip(hist.tolist(), bar_lens.tolist(), edges[:-1].tolist(), edges[1:].tolist())
+    )
     console.print(f"Histogram for [bold]{column}[/bold] ({data.size} values):")
-    for count, left, right in zip(hist, edges[:-1], edges[1:]):
-        bar_len = int((count / max_count) * width) if max_count > 0 else 0
-        bar = "*" * bar_len
-        console.print(f"{left: .4g} – {right: .4g} | {bar} ({count})")
+    console.print(block)
 
 
 @app.command("plot")
@@ -171,12 +393,14 @@ def plot(
     """
     ASCII scatter/line plot of two numeric columns.
     """
-    headers, rows = _load_table(file, delimiter=delimiter)
+    import numpy as np
+
+    headers, values = _load_numeric(file, delimiter=delimiter)
     if xcol not in headers or ycol not in headers:
         console.print(f"[red]Columns not found. Available: {', '.join(headers)}[/red]")
         raise typer.Exit(code=1)
 
-    pts = _extract_numeric_pairs(rows, xcol, ycol)
+    pts = _numeric_pairs(values, headers.index(xcol), headers.index(ycol))
     if pts.size == 0:
         console.print("[yellow]No numeric data found for the requested columns.[/yellow]")
         raise typer.Exit(code=1)
@@ -192,15 +416,12 @@ def plot(
         ymax += 1.0
         ymin -= 1.0
 
-    grid = [[" " for _ in range(width)] for _ in range(height)]
-
-    for x, y in pts:
-        xi = int((x - xmin) / (xmax - xmin) * (width - 1))
-        yi = int((y - ymin) / (ymax - ymin) * (height - 1))
-        yi = (height - 1) - yi  # invert y for display
-        grid[yi][xi] = "*"
+    # Scatter every point into a byte grid in one vectorized assignment.
+    xi = ((x_vals - xmin) / (xmax - xmin) * (width - 1)).astype(np.int64)
+    yi = (height - 1) - ((y_vals - ymin) / (ymax - ymin) * (height - 1)).astype(np.int64)  # invert y for display
+    grid = np.full((height, width), ord(" "), dtype=np.uint8)
+    grid[yi, xi] = ord("*")
 
     console.print(f"[bold]Plot {ycol} vs {xcol}[/bold] ({len(pts)} points)")
     console.print(f"x in [{xmin:.4g}, {xmax:.4g}], y in [{ymin:.4g}, {ymax:.4g}]")
-    for row in grid:
-        console.print("".join(row))
+    console.print("\n".join(row.tobytes().decode("ascii") for row in grid))
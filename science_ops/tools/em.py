@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 import math
+from pathlib import Path
 
 import typer
-from rich.console import Console
+
+from science_ops.ui import console, emit_numeric_rows
+from science_ops.utils.io import read_numeric_rows
 
 app = typer.Typer(help="Electromagnetism tools: Coulomb force and reactance helpers.")
-console = Console()
 
 COULOMB_CONSTANT = 8.9875517923e9  # N m^2 / C^2
 
@@ -33,6 +35,36 @@ def coulomb_force(
     console.print(f"F = [bold]{magnitude:.6g} N[/bold] ({interaction})")
 
 
+@app.command("coulomb-batch")
+def coulomb_batch(
+    file: Path = typer.Argument(..., exists=True, readable=True, help="CSV/TSV of q1,q2,r rows."),
+    output: Path | None = typer.Option(None, "--output", "-o", help="Write results to this CSV instead of stdout."),
+) -> None:
+    """
+    Coulomb force for every row of a q1,q2,r file in one pass.
+
+    The sign column is +1 for repulsive and -1 for attractive pairs.
+    """
+    import numpy as np
+
+    try:
+        rows = read_numeric_rows(file, 3)
+    except ValueError as exc:
+        console.print(f"[red]{exc}[/red]")
+        raise typer.Exit(code=1) from exc
+
+    q1, q2, r = rows[:, 0], rows[:, 1], rows[:, 2]
+    bad = np.flatnonzero(r <= 0)
+    if bad.size:
+        console.print(f"[red]Separation distance r must be positive (data row {bad[0] + 1}).[/red]")
+        raise typer.Exit(code=1)
+
+    qq = q1 * q2
+    magnitude = COULOMB_CONSTANT * np.abs(qq) / (r * r)
+    sign = np.where(qq > 0, 1.0, -1.0)
+    emit_numeric_rows(["q1", "q2", "r", "force_N", "sign"], np.column_stack((q1, q2, r, magnitude, sign)), output)
+
+
 @app.command("reactance")
 def reactance(
     freq: float = typer.Argument(..., help="Frequency (Hz)."),
@@ -53,7 +85,7 @@ def reactance(
         console.print("[red]Provide at least one of --L or --C (positive values).[/red]")
         raise typer.Exit(code=1)
 
-    omega = 2 * math.pi * freq
+    omega = math.tau * freq
     x_l = omega * inductance if inductance > 0 else 0.0
     x_c = -(1.0 / (omega * capacitance)) if capacitance > 0 else 0.0
     x_total = x_l + x_c
@@ -1,15 +1,15 @@
 from __future__ import annotations
 
+import sys
 from pathlib import Path
 
 import typer
-from rich.console import Console
 
 from science_ops.config import load_config, save_config
-from science_ops.utils.io import append_line, timestamp
+from science_ops.ui import console
+from science_ops.utils.io import append_line, append_lines, timestamp
 
 app = typer.Typer(help="Simple lab notebook logging.")
-console = Console()
 
 
 @app.command("log")
@@ -23,6 +23,23 @@ def log_entry(
     console.print(f"Logged to [green]{cfg.notebook_path}[/green]")
 
 
+@app.command("log-batch")
+def log_batch(
+    source: str = typer.Argument("-", help="File with one note per line, or '-' for stdin."),
+) -> None:
+    """Append one timestamped entry per non-blank line, in a single write."""
+    cfg = load_config()
+    try:
+        raw = sys.stdin.read() if source == "-" else Path(source).read_text(encoding="utf-8")
+    except OSError as exc:
+        console.print(f"[red]Could not read {source}: {exc}[/red]")
+        raise typer.Exit(code=1) from exc
+
+    stamp = timestamp()
+    count = append_lines(cfg.notebook_path, (f"- [{stamp}] {text}" for text in raw.splitlines() if text.strip()))
+    console.print(f"Logged {count} entries to [green]{cfg.notebook_path}[/green]")
+
+
 @app.command("show")
 def show_notebook() -> None:
     """Print the current notebook contents."""
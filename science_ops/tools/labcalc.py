@@ -1,11 +1,11 @@
 from __future__ import annotations
 
 import typer
-from rich.console import Console
 from rich.table import Table
 
+from science_ops.ui import console
+
 app = typer.Typer(help="General lab calculations: dilutions, error, solution prep.")
-console = Console()
 
 
 @app.command("stock-dilution")
@@ -2,13 +2,12 @@ from __future__ import annotations
 
 import math
 import typer
-from rich.console import Console
 
+from science_ops.ui import console
 from science_ops.utils.display import simple_table
-from .physics_constants import BODIES, get_body
+from .physics_constants import BODIES, KNOWN_BODIES_STR, get_body
 
 app = typer.Typer(help="Classical mechanics tools: projectiles, work, energy, orbits.")
-console = Console()
 
 DEFAULT_BODY = "earth"
 DEFAULT_G = BODIES[DEFAULT_BODY]["g"]
@@ -22,7 +21,7 @@ def projectile_motion(
     y0: float = typer.Option(0.0, "--y0", help="Initial height (m)."),
     g: float = typer.Option(DEFAULT_G, "--g", help="Gravitational acceleration (m/s^2)."),
     body: str | None = typer.Option(
-        None, "--body", help=f"Preset surface gravity body ({', '.join(sorted(BODIES))}). Overrides --g."
+        None, "--body", help=f"Preset surface gravity body ({KNOWN_BODIES_STR}). Overrides --g."
     ),
 ) -> None:
     """
@@ -37,7 +36,7 @@ def projectile_motion(
         try:
             g = get_body(body)["g"]
         except KeyError:
-            console.print(f"[red]Unknown body '{body}'. Try: {', '.join(sorted(BODIES))}.[/red]")
+            console.print(f"[red]Unknown body '{body}'. Try: {KNOWN_BODIES_STR}.[/red]")
             raise typer.Exit(code=1)
 
     theta = math.radians(angle_deg)
@@ -109,7 +108,7 @@ def simple_pendulum(
     length: float = typer.Argument(..., help="Pendulum length (m)."),
     g: float = typer.Option(DEFAULT_G, "--g", help="Gravitational acceleration (m/s^2)."),
     body: str | None = typer.Option(
-        None, "--body", help=f"Preset surface gravity body ({', '.join(sorted(BODIES))}). Overrides --g."
+        None, "--body", help=f"Preset surface gravity body ({KNOWN_BODIES_STR}). Overrides --g."
     ),
 ) -> None:
     """
@@ -121,7 +120,7 @@ def simple_pendulum(
         try:
             g = get_body(body)["g"]
         except KeyError:
-            console.print(f"[red]Unknown body '{body}'. Try: {', '.join(sorted(BODIES))}.[/red]")
+            console.print(f"[red]Unknown body '{body}'. Try: {KNOWN_BODIES_STR}.[/red]")
             raise typer.Exit(code=1)
 
     if length <= 0:
@@ -131,7 +130,7 @@ def simple_pendulum(
         console.print("[red]g must be > 0 m/s^2.[/red]")
         raise typer.Exit(code=1)
 
-    T = 2 * math.pi * math.sqrt(length / g)
+    T = math.tau * math.sqrt(length / g)
     console.print(f"T = [bold]{T:.6g} s[/bold]")
 
 
@@ -144,7 +143,7 @@ def orbit_period(
         help="Standard gravitational parameter μ = GM (m^3/s^2). Default = Earth.",
     ),
     body: str | None = typer.Option(
-        None, "--body", help=f"Preset central body for μ ({', '.join(sorted(BODIES))}). Overrides --mu."
+        None, "--body", help=f"Preset central body for μ ({KNOWN_BODIES_STR}). Overrides --mu."
     ),
 ) -> None:
     """
@@ -156,7 +155,7 @@ def orbit_period(
         try:
             mu = get_body(body)["mu"]
         except KeyError:
-            console.print(f"[red]Unknown body '{body}'. Try: {', '.join(sorted(BODIES))}.[/red]")
+            console.print(f"[red]Unknown body '{body}'. Try: {KNOWN_BODIES_STR}.[/red]")
             raise typer.Exit(code=1)
 
     if semi_major_axis <= 0:
@@ -166,5 +165,5 @@ def orbit_period(
         console.print("[red]μ must be > 0 m^3/s^2.[/red]")
         raise typer.Exit(code=1)
 
-    T = 2 * math.pi * math.sqrt(semi_major_axis ** 3 / mu)
+    T = math.tau * math.sqrt(semi_major_axis ** 3 / mu)
     console.print(f"T = [bold]{T:.6g} s[/bold]")
@@ -3,10 +3,53 @@ from __future__ import annotations
 import math
 
 import typer
-from rich.console import Console
+
+from science_ops.ui import console
 
 app = typer.Typer(help="Geometric optics tools: Snell's law, thin lens, mirrors.")
-console = Console()
+
+
+def snell_batch(n1, n2, theta1_deg):
+    """
+    Refraction angles θ2 in degrees for arrays of n1, n2 and θ1.
+
+    NaN marks rays that undergo total internal reflection.
+    """
+    import numpy as np
+
+    n1 = np.asarray(n1, dtype=float)
+    n2 = np.asarray(n2, dtype=float)
+    if np.any(n1 <= 0) or np.any(n2 <= 0):
+        raise ValueError("Indices of refraction must be positive.")
+    sin_theta2 = n1 / n2 * np.sin(np.deg2rad(np.asarray(theta1_deg, dtype=float)))
+    with np.errstate(invalid="ignore"):
+        return np.where(np.abs(sin_theta2) <= 1.0, np.rad2deg(np.arcsin(sin_theta2)), np.nan)
+
+
+def _thin_lens(f: float, d_o: float) -> float:
+    """Image distance d_i from 1/f = 1/d_o + 1/d_i; math.inf when the image is at infinity."""
+    inv_f, inv_o = 1.0 / f, 1.0 / d_o
+    denom = inv_f - inv_o
+    # Relative tolerance: 1/f and 1/d_o that agree to rounding mean f == d_o.
+    if abs(denom) <= 1e-12 * max(abs(inv_f), abs(inv_o)):
+        return math.inf
+    return 1.0 / denom
+
+
+def thin_lens_batch(f, d_o):
+    """
+    Image distances d_i for arrays of focal lengths and object distances.
+
+    As in _thin_lens, an object at the focal point gives inf.
+    """
+    import numpy as np
+
+    inv_f = np.reciprocal(np.asarray(f, dtype=float))
+    inv_o = np.reciprocal(np.asarray(d_o, dtype=float))
+    denom = inv_f - inv_o
+    at_infinity = np.abs(denom) <= 1e-12 * np.maximum(np.abs(inv_f), np.abs(inv_o))
+    with np.errstate(divide="ignore"):
+        return np.where(at_infinity, np.inf, np.reciprocal(denom))
 
 
 @app.command("snell")
@@ -61,12 +104,11 @@ def thin_lens(
         console.print("[red]Object distance d_o cannot be zero.[/red]")
         raise typer.Exit(code=1)
 
-    denom = (1.0 / f) - (1.0 / d_o)
-    if denom == 0:
+    d_i = _thin_lens(f, d_o)
+    if math.isinf(d_i):
         console.print("[yellow]Image at infinity (collimated output).[/yellow]")
         return
 
-    d_i = 1.0 / denom
     m = -d_i / d_o
 
     image_type = "real" if d_i > 0 else "virtual"
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Dict
 
 # Fundamental constants
@@ -60,6 +61,11 @@ BODIES: Dict[str, Dict[str, float]] = {
 }
 
 
+# Sorted, comma-separated body names for help and error messages.
+KNOWN_BODIES_STR = ", ".join(sorted(BODIES))
+
+
+@lru_cache(maxsize=None)
 def get_body(name: str) -> Dict[str, float]:
     key = name.lower()
     if key not in BODIES:
@@ -68,4 +74,4 @@ def get_body(name: str) -> Dict[str, float]:
 
 
 def known_bodies() -> str:
-    return ", ".join(sorted(BODIES))
+    return KNOWN_BODIES_STR
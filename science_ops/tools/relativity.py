@@ -3,18 +3,31 @@ from __future__ import annotations
 import math
 
 import typer
-from rich.console import Console
 
-from .physics_constants import BODIES, get_body, C, G
+from science_ops.ui import console
+from .physics_constants import KNOWN_BODIES_STR, get_body, C, G
 
 app = typer.Typer(help="Relativity tools: time dilation, length contraction, energy.")
-console = Console()
+
+
+_C2 = C * C
 
 
 def _gamma_from_beta(beta: float) -> float:
     if beta < 0 or beta >= 1:
         raise ValueError("β must be in [0, 1).")
-    return 1.0 / math.sqrt(1.0 - beta * beta)
+    # (1 - β)(1 + β) keeps precision as β -> 1, where 1 - β² cancels.
+    return 1.0 / math.sqrt((1.0 - beta) * (1.0 + beta))
+
+
+def gamma_array(beta):
+    """Lorentz factors for an array of β; raises ValueError if any β is outside [0, 1)."""
+    import numpy as np
+
+    b = np.asarray(beta, dtype=float)
+    if np.any((b < 0) | (b >= 1)):
+        raise ValueError("β must be in [0, 1).")
+    return 1.0 / np.sqrt((1.0 - b) * (1.0 + b))
 
 
 @app.command("gamma")
@@ -132,7 +145,7 @@ def relativistic_energy(
         console.print(f"[red]{e}[/red]")
         raise typer.Exit(code=1)
 
-    mc2 = mass * C * C
+    mc2 = mass * _C2
     E = gamma * mc2
     K = (gamma - 1.0) * mc2
 
@@ -153,7 +166,7 @@ def gravitational_time_dilation(
     body: str | None = typer.Option(
         "earth",
         "--body",
-        help=f"Preset body for mass/radius ({', '.join(sorted(BODIES))}). Use 'none' to disable presets.",
+        help=f"Preset body for mass/radius ({KNOWN_BODIES_STR}). Use 'none' to disable presets.",
     ),
     altitude: float = typer.Option(
         0.0, "--altitude", help="Altitude above body surface (m) when using --body presets."
@@ -173,7 +186,7 @@ def gravitational_time_dilation(
         try:
             data = get_body(body)
         except KeyError:
-            console.print(f"[red]Unknown body '{body}'. Try: {', '.join(sorted(BODIES))}.[/red]")
+            console.print(f"[red]Unknown body '{body}'. Try: {KNOWN_BODIES_STR}.[/red]")
             raise typer.Exit(code=1)
         mass_val = data["mass"]
         radius_val = data["radius"] + max(0.0, altitude)
@@ -189,7 +202,7 @@ def gravitational_time_dilation(
         console.print("[red]Mass and radius must be positive.[/red]")
         raise typer.Exit(code=1)
 
-    rs_over_r = 2 * G * mass_val / (radius_val * C * C)
+    rs_over_r = 2 * G * mass_val / (radius_val * _C2)
     if rs_over_r >= 1:
         console.print("[red]r is at or inside the Schwarzschild radius; formula breaks.[/red]")
         raise typer.Exit(code=1)
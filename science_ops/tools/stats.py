@@ -1,15 +1,18 @@
 from __future__ import annotations
 
+import math
 from typing import List
 
 import typer
-from rich.console import Console
 from rich.table import Table
 
+from science_ops.ui import console
 from science_ops.utils.math_helpers import describe
 
 app = typer.Typer(help="Basic statistics helpers.")
-console = Console()
+
+_INV_SQRT_2PI = 1.0 / math.sqrt(2 * math.pi)
+_SQRT_2 = math.sqrt(2.0)
 
 
 @app.command("describe")
@@ -22,8 +25,10 @@ def describe_cmd(
     table.add_column("Metric")
     table.add_column("Value")
 
-    for k in ["count", "mean", "std", "min", "max", "median"]:
-        table.add_row(k, f"{stats[k]:.6g}" if k != "count" else str(stats[k]))
+    rows = [("count", str(stats["count"]))]
+    rows += [(k, format(stats[k], ".6g")) for k in ("mean", "std", "min", "max", "median")]
+    for row in rows:
+        table.add_row(*row)
 
     console.print(table)
 
@@ -35,14 +40,13 @@ def normal_pdf(
     sigma: float = typer.Option(1.0, "--sigma", help="Standard deviation."),
 ) -> None:
     """Evaluate the normal distribution PDF at x."""
-    import math
-
     if sigma <= 0:
         console.print("[red]Sigma must be positive.[/red]")
         raise typer.Exit(code=1)
 
-    coeff = 1.0 / (sigma * math.sqrt(2 * math.pi))
-    z = (x - mu) / sigma
+    inv_sigma = 1.0 / sigma
+    coeff = inv_sigma * _INV_SQRT_2PI
+    z = (x - mu) * inv_sigma
     pdf = coeff * math.exp(-0.5 * z * z)
     console.print(f"pdf(x={x}, mu={mu}, sigma={sigma}) = [bold]{pdf:.10g}[/bold]")
 
@@ -54,13 +58,12 @@ def normal_cdf(
     sigma: float = typer.Option(1.0, "--sigma", help="Standard deviation."),
 ) -> None:
     """Approximate the normal distribution CDF at x."""
-    import math
-
     if sigma <= 0:
         console.print("[red]Sigma must be positive.[/red]")
         raise typer.Exit(code=1)
 
-    z = (x - mu) / (sigma * math.sqrt(2.0))
+    inv = 1.0 / (sigma * _SQRT_2)
+    z = (x - mu) * inv
     # Using error function erf
     cdf = 0.5 * (1.0 + math.erf(z))
     console.print(f"cdf(x={x}, mu={mu}, sigma={sigma}) = [bold]{cdf:.10g}[/bold]")
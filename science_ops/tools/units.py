@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+from functools import lru_cache
+
 import typer
-from rich.console import Console
+
+from science_ops.ui import console
 
 app = typer.Typer(help="Unit conversion with simple dimensional analysis.")
-console = Console()
 
 # Very minimal; extend later.
 # Model: dimension -> { unit_name: (scale_to_SI, symbol) }
@@ -41,11 +43,31 @@ DIMENSIONS = {
 }
 
 
+# Flat unit -> (dimension, scale_to_SI) index, built once at import.
+UNIT_INDEX: dict[str, tuple[str, float]] = {
+    unit: (dim, scale) for dim, table in DIMENSIONS.items() for unit, (scale, _) in table.items()
+}
+
+
 def find_dimension(unit: str) -> str | None:
-    for dim, table in DIMENSIONS.items():
-        if unit in table:
-            return dim
-    return None
+    entry = UNIT_INDEX.get(unit)
+    return entry[0] if entry is not None else None
+
+
+@lru_cache(maxsize=256)
+def _ratio(from_unit: str, to_unit: str) -> float:
+    """Factor taking a value in from_unit to to_unit (scale_from / scale_to)."""
+    from_entry = UNIT_INDEX.get(from_unit)
+    if from_entry is None:
+        raise ValueError(f"Unknown unit: {from_unit}")
+    to_entry = UNIT_INDEX.get(to_unit)
+    if to_entry is None:
+        raise ValueError(f"Unknown unit: {to_unit}")
+    from_dim, scale_from = from_entry
+    to_dim, scale_to = to_entry
+    if from_dim != to_dim:
+        raise ValueError(f"Incompatible units: '{from_unit}' ({from_dim}) vs '{to_unit}' ({to_dim}).")
+    return scale_from / scale_to
 
 
 @app.command("list-dimensions")
@@ -63,27 +85,12 @@ def convert(
     to_unit: str = typer.Argument(..., help="Target unit, e.g. 'km/h'."),
 ) -> None:
     """Convert a value between compatible units."""
-    from_dim = find_dimension(from_unit)
-    to_dim = find_dimension(to_unit)
-
-    if from_dim is None:
-        console.print(f"[red]Unknown unit: {from_unit}[/red]")
-        raise typer.Exit(code=1)
-    if to_dim is None:
-        console.print(f"[red]Unknown unit: {to_unit}[/red]")
-        raise typer.Exit(code=1)
-    if from_dim != to_dim:
-        console.print(
-            f"[red]Incompatible units: '{from_unit}' ({from_dim}) vs '{to_unit}' ({to_dim}).[/red]"
-        )
-        raise typer.Exit(code=1)
-
-    scale_from, _ = DIMENSIONS[from_dim][from_unit]
-    scale_to, _ = DIMENSIONS[to_dim][to_unit]
-
-    # value_in_SI = value * scale_from
-    # value_target = value_in_SI / scale_to
-    value_SI = value * scale_from
-    value_target = value_SI / scale_to
+    try:
+        ratio = _ratio(from_unit, to_unit)
+    except ValueError as exc:
+        console.print(f"[red]{exc}[/red]")
+        raise typer.Exit(code=1) from exc
+
+    value_target = value * ratio
 
     console.print(f"{value} {from_unit} = [bold]{value_target:.6g} {to_unit}[/bold]")
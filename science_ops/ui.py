@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Sequence
+
+import typer
+
+from science_ops.utils.io import format_numeric_rows, write_numeric_rows
+
+if TYPE_CHECKING:
+    import numpy as np
+    from rich.console import Console
+
+
+class _LazyConsole:
+    """Stands in for the shared Console, importing Rich and building it on first use."""
+
+    _console: Console | None = None
+
+    def __getattr__(self, name: str) -> Any:
+        if _LazyConsole._console is None:
+            from rich.console import Console
+
+            _LazyConsole._console = Console()
+        return getattr(_LazyConsole._console, name)
+
+
+# One Console shared by the CLI and every tool module.
+console = _LazyConsole()
+
+
+def emit_numeric_rows(header: Sequence[str], rows: np.ndarray, output: Path | None) -> None:
+    """Print batch results as CSV, or write them to `output` and report the row count."""
+    if output is None:
+        # Plain stdout: Rich would wrap long records at the terminal width.
+        typer.echo(format_numeric_rows(header, rows), nl=False)
+        return
+    write_numeric_rows(output, header, rows)
+    console.print(f"Wrote {rows.shape[0]} rows to [green]{output}[/green]")
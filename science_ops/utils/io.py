@@ -1,14 +1,105 @@
 from __future__ import annotations
 
+import csv
+import time
+import warnings
 from pathlib import Path
-from datetime import datetime
+from typing import TYPE_CHECKING, Iterable, Sequence
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+# Parent directories already created this process; skips a mkdir per write.
+_known_dirs: set[Path] = set()
+
+
+def _ensure_parent(path: Path) -> None:
+    parent = path.parent
+    if parent not in _known_dirs:
+        parent.mkdir(parents=True, exist_ok=True)
+        _known_dirs.add(parent)
 
 
 def append_line(path: Path, line: str) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
+    _ensure_parent(path)
     with path.open("a", encoding="utf-8") as f:
         f.write(line.rstrip() + "\n")
 
 
+def append_lines(path: Path, lines: Iterable[str]) -> int:
+    """Append many lines with a single open and buffered write; returns the count."""
+    _ensure_parent(path)
+    text = [line.rstrip() + "\n" for line in lines]
+    with path.open("a", encoding="utf-8") as f:
+        f.writelines(text)
+    return len(text)
+
+
 def timestamp() -> str:
-    return datetime.now().isoformat(timespec="seconds")
+    # Same output as datetime.now().isoformat(timespec="seconds"), without the datetime object.
+    return time.strftime("%Y-%m-%dT%H:%M:%S")
+
+
+_SNIFF_DELIMITERS = ",\t;|"
+
+
+def sniff_delimiter(line: str) -> str:
+    """Guess the delimiter of a delimited text file from one line (usually the header)."""
+    try:
+        return csv.Sniffer().sniff(line, delimiters=_SNIFF_DELIMITERS).delimiter
+    except csv.Error:
+        return "\t" if ("," not in line and "\t" in line) else ","
+
+
+def quiet_loadtxt(fname, **kwargs) -> np.ndarray:
+    """np.loadtxt without its "input contained no data" warning; callers check for empty results."""
+    import numpy as np
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", UserWarning)
+        return np.loadtxt(fname, **kwargs)
+
+
+def read_numeric_rows(path: Path, n_cols: int) -> np.ndarray:
+    """
+    Read the first n_cols columns of a delimited numeric file into an
+    (N, n_cols) float array. The delimiter is sniffed like `data` does, and a
+    non-numeric first line is treated as a header and skipped. Raises
+    ValueError on malformed or missing rows.
+    """
+    import numpy as np
+
+    # utf-8-sig strips a BOM, which would otherwise make the first cell non-numeric.
+    with path.open("r", encoding="utf-8-sig", newline="") as f:
+        first = f.readline()
+    delimiter = sniff_delimiter(first)
+    first_cell = next(csv.reader([first], delimiter=delimiter), [""])
+    try:
+        float(first_cell[0] if first_cell else "")
+        skip = 0
+    except ValueError:
+        skip = 1
+    rows = quiet_loadtxt(
+        path,
+        delimiter=delimiter,
+        skiprows=skip,
+        usecols=range(n_cols),
+        dtype=np.float64,
+        ndmin=2,
+        encoding="utf-8-sig",
+    )
+    if rows.shape[0] == 0:
+        raise ValueError(f"{path} has no data rows.")
+    return rows
+
+
+def format_numeric_rows(header: Sequence[str], rows: np.ndarray) -> str:
+    """Render a float array as CSV text with a header line; values round-trip exactly."""
+    lines = [",".join(header)]
+    lines += [",".join(map(repr, row)) for row in rows.tolist()]
+    return "\n".join(lines) + "\n"
+
+
+def write_numeric_rows(path: Path, header: Sequence[str], rows: np.ndarray) -> None:
+    path.write_text(format_numeric_rows(header, rows), encoding="utf-8")
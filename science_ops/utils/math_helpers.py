@@ -1,24 +1,75 @@
 from __future__ import annotations
 
-from typing import Iterable, Tuple
+import math
+from typing import TYPE_CHECKING, Iterable, Tuple
 
-import numpy as np
+if TYPE_CHECKING:
+    import numpy as np
 
 
 def describe(data: Iterable[float]) -> dict:
-    arr = np.array(list(data), dtype=float)
+    import numpy as np
+
+    # Avoid copying through a Python list: arrays are used as-is and sized
+    # sequences are filled in one preallocated pass.
+    if isinstance(data, np.ndarray):
+        arr = data.astype(float, copy=False).ravel()
+    elif hasattr(data, "__len__"):
+        arr = np.fromiter(data, dtype=float, count=len(data))
+    else:
+        arr = np.fromiter(data, dtype=float)
     if arr.size == 0:
         raise ValueError("No data provided")
 
+    n = int(arr.size)
+    # inf input makes inf - inf below; the NaN result is intended, the warning is not.
+    with np.errstate(invalid="ignore", over="ignore"):
+        mean = float(arr.sum()) / n
+        dev = arr - mean
+        std = float(np.sqrt(np.dot(dev, dev) / (n - 1))) if n > 1 else 0.0
+
+    # One partition places min, max and the median element(s) at once,
+    # instead of separate min/max reductions plus a median sort.
+    hi, lo = n // 2, (n - 1) // 2
+    part = np.partition(arr, sorted({0, lo, hi, n - 1}))
+    if math.isnan(part[-1]):
+        # partition sorts NaN last; match np.min/np.median, which propagate it.
+        lo_val = hi_val = median = math.nan
+    else:
+        lo_val, hi_val = float(part[0]), float(part[-1])
+        median = float(part[lo] + part[hi]) / 2.0
     return {
-        "count": int(arr.size),
-        "mean": float(arr.mean()),
-        "std": float(arr.std(ddof=1)) if arr.size > 1 else 0.0,
-        "min": float(arr.min()),
-        "max": float(arr.max()),
-        "median": float(np.median(arr)),
+        "count": n,
+        "mean": mean,
+        "std": std,
+        "min": lo_val,
+        "max": hi_val,
+        "median": median,
     }
 
 
 def linspace(start: float, stop: float, num: int) -> np.ndarray:
+    import numpy as np
+
     return np.linspace(start, stop, num=num)
+
+
+def normal_cdf_array(x, mu: float = 0.0, sigma: float = 1.0) -> np.ndarray:
+    """
+    Normal CDF evaluated element-wise over array-like x.
+
+    Uses scipy.special.ndtr when SciPy is installed (the `fast` extra).
+    Without SciPy it calls math.erf once per element via np.frompyfunc,
+    which is a Python-level loop: correct, but no faster than normal_cdf.
+    """
+    import numpy as np
+
+    if sigma <= 0:
+        raise ValueError("Sigma must be positive.")
+    z = (np.asarray(x, dtype=float) - mu) / sigma
+    try:
+        from scipy.special import ndtr
+    except ImportError:
+        erf = np.frompyfunc(math.erf, 1, 1)
+        return 0.5 * (1.0 + np.asarray(erf(z / math.sqrt(2.0)), dtype=float))
+    return ndtr(z)
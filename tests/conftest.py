@@ -1,5 +1,9 @@
 import os
+import tempfile
 
 # Disable ANSI color codes during tests for stable output matching.
 os.environ.setdefault("NO_COLOR", "1")
 os.environ.setdefault("RICH_COLOR_SYSTEM", "none")
+
+# Keep the on-disk table cache out of the real home directory.
+os.environ.setdefault("XDG_CACHE_HOME", tempfile.mkdtemp(prefix="science_ops_cache_"))
@@ -1,5 +1,8 @@
 from datetime import datetime, timezone
 
+import pytest
+import typer
+
 from science_ops.tools.astro import _parse_dec, _parse_ra, local_sidereal_time
 
 
@@ -15,3 +18,41 @@ def test_lst_in_range():
     dt = datetime(2024, 1, 1, tzinfo=timezone.utc)
     lst_deg = local_sidereal_time(dt, lon_deg=0.0)
     assert 0.0 <= lst_deg < 360.0
+
+
+def test_parse_sexagesimal_separators():
+    assert abs(_parse_ra("10:12:45") - _parse_ra("10h12m45s")) < 1e-9
+    assert abs(_parse_dec("+12°30'00\"") - 12.5) < 1e-6
+    assert abs(_parse_dec("-12 30 00") + 12.5) < 1e-6
+
+
+def test_parse_accepts_exponent_notation():
+    assert abs(_parse_ra("1e1") - 150.0) < 1e-9
+    assert abs(_parse_ra("1e1h") - 150.0) < 1e-9
+    assert abs(_parse_dec("-1.25e1") + 12.5) < 1e-9
+
+
+@pytest.mark.parametrize("text", ["12.30.45", "1.5.3"])
+def test_parse_rejects_unseparated_components(text):
+    with pytest.raises(typer.BadParameter):
+        _parse_ra(text)
+    with pytest.raises(typer.BadParameter):
+        _parse_dec(text)
+
+
+def test_julian_date_j2000():
+    from science_ops.tools.astro import _julian_date
+
+    assert _julian_date(datetime(2000, 1, 1, 12, tzinfo=timezone.utc)) == 2451545.0
+
+
+def test_altaz_array_matches_scalar():
+    from science_ops.tools.astro import ra_dec_to_altaz, ra_dec_to_altaz_array
+
+    ras = [10.0, 150.0, 300.0]
+    decs = [20.0, -45.0, 80.0]
+    alts, azs = ra_dec_to_altaz_array(ras, decs, 37.8, 123.0)
+    for ra, dec, alt, az in zip(ras, decs, alts, azs):
+        exp_alt, exp_az = ra_dec_to_altaz(ra, dec, 37.8, 123.0)
+        assert abs(alt - exp_alt) < 1e-9
+        assert abs(az - exp_az) < 1e-9
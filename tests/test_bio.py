@@ -11,3 +11,35 @@ def test_gc_content_basic():
 
 def test_codon_table_complete():
     assert len(bio.CODON_TABLE) == 64
+
+
+# Standard genetic code, written out independently of bio's packed table.
+STANDARD_CODE = {
+    "TTT": "F", "TTC": "F", "TTA": "L", "TTG": "L",
+    "TCT": "S", "TCC": "S", "TCA": "S", "TCG": "S",
+    "TAT": "Y", "TAC": "Y", "TAA": "*", "TAG": "*",
+    "TGT": "C", "TGC": "C", "TGA": "*", "TGG": "W",
+    "CTT": "L", "CTC": "L", "CTA": "L", "CTG": "L",
+    "CCT": "P", "CCC": "P", "CCA": "P", "CCG": "P",
+    "CAT": "H", "CAC": "H", "CAA": "Q", "CAG": "Q",
+    "CGT": "R", "CGC": "R", "CGA": "R", "CGG": "R",
+    "ATT": "I", "ATC": "I", "ATA": "I", "ATG": "M",
+    "ACT": "T", "ACC": "T", "ACA": "T", "ACG": "T",
+    "AAT": "N", "AAC": "N", "AAA": "K", "AAG": "K",
+    "AGT": "S", "AGC": "S", "AGA": "R", "AGG": "R",
+    "GTT": "V", "GTC": "V", "GTA": "V", "GTG": "V",
+    "GCT": "A", "GCC": "A", "GCA": "A", "GCG": "A",
+    "GAT": "D", "GAC": "D", "GAA": "E", "GAG": "E",
+    "GGT": "G", "GGC": "G", "GGA": "G", "GGG": "G",
+}
+
+
+def test_codon_table_matches_standard_code():
+    assert bio.CODON_TABLE == STANDARD_CODE
+
+
+def test_translate_codons_matches_standard_code():
+    seq = "".join(STANDARD_CODE) + "NAC"
+    expected = "".join(STANDARD_CODE.values()) + "X"
+    assert bio._translate_codons(seq) == expected
+    assert bio._translate_codons("AATG", 1) == "M"
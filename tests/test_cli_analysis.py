@@ -1,6 +1,9 @@
-from typer.testing import CliRunner
+import re
 from pathlib import Path
 
+import pytest
+from typer.testing import CliRunner
+
 from science_ops.cli import app
 
 runner = CliRunner()
@@ -24,3 +27,40 @@ def test_analysis_uncertainty():
     result = runner.invoke(app, ["analysis", "uncertainty", "1.0", "2.0"])
     assert result.exit_code == 0
     assert "Combined uncertainty" in result.stdout
+
+
+def test_analysis_regress_constant_x(tmp_path):
+    p = tmp_path / "flat.csv"
+    p.write_text("x,y\n1,2\n1,3\n1,4\n", encoding="utf-8")
+    result = runner.invoke(app, ["analysis", "regress", str(p), "x", "y"])
+    assert result.exit_code == 1
+    assert "slope is undefined" in result.stdout
+
+
+def test_analysis_regress_skips_blank_cells(tmp_path):
+    p = tmp_path / "gaps.csv"
+    p.write_text("x,y\n1,2\n2,\n3,6\n4,8\n", encoding="utf-8")
+    result = runner.invoke(app, ["analysis", "regress", str(p), "x", "y"])
+    assert result.exit_code == 0
+    assert "slope" in result.stdout
+
+
+def test_analysis_regress_large_x_offset(tmp_path):
+    # Unix-timestamp-sized x: raw sums of squares would cancel to nothing.
+    p = tmp_path / "ts.csv"
+    p.write_text("t,v\n" + "".join(f"{1.7e9 + 0.01 * i!r},{0.02 * i!r}\n" for i in range(100)), encoding="utf-8")
+    result = runner.invoke(app, ["analysis", "regress", str(p), "t", "v"])
+    assert result.exit_code == 0
+    slope = re.search(r"slope \(m\)\s*│\s*(\S+)", result.stdout).group(1)
+    r = re.search(r"│ r\s*│\s*(\S+)", result.stdout).group(1)
+    assert float(slope) == pytest.approx(2.0, rel=1e-4)
+    assert float(r) == pytest.approx(1.0, rel=1e-6)
+
+
+def test_analysis_regress_quoted_delimiter_in_other_column(tmp_path):
+    p = tmp_path / "quoted.csv"
+    p.write_text('label,x,y\n"a,5,6,b",1,2\nplain,2,4\nother,3,6\n', encoding="utf-8")
+    result = runner.invoke(app, ["analysis", "regress", str(p), "x", "y"])
+    assert result.exit_code == 0
+    slope = re.search(r"slope \(m\)\s*│\s*(\S+)", result.stdout).group(1)
+    assert float(slope) == pytest.approx(2.0)
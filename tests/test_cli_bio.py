@@ -28,3 +28,10 @@ def test_bio_find_orfs():
     result = runner.invoke(app, ["bio", "find-orfs", seq, "--min-aa", "2"])
     assert result.exit_code == 0
     assert "ORFs" in result.stdout
+
+
+def test_bio_gc_content_ignores_invalid_bases():
+    result = runner.invoke(app, ["bio", "gc-content", "GCNNAT"])
+    assert result.exit_code == 0
+    assert "ignoring invalid characters: N" in result.stdout
+    assert "GC fraction = 0.5" in result.stdout
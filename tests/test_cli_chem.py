@@ -9,3 +9,24 @@ def test_chem_help_runs():
     result = runner.invoke(app, ["chem", "--help"])
     assert result.exit_code == 0
     assert "Usage" in result.stdout or "Commands" in result.stdout
+
+
+def test_chem_molarity_batch(tmp_path):
+    src = tmp_path / "in.csv"
+    src.write_text("moles,volume_l\n0.5,1\n1,0.25\n", encoding="utf-8")
+    out = tmp_path / "out.csv"
+    result = runner.invoke(app, ["chem", "molarity-batch", str(src), "--output", str(out)])
+    assert result.exit_code == 0
+    assert out.read_text(encoding="utf-8").splitlines() == [
+        "moles,volume_l,molarity_M",
+        "0.5,1.0,0.5",
+        "1.0,0.25,4.0",
+    ]
+
+
+def test_chem_dilute_batch_rejects_concentrating(tmp_path):
+    src = tmp_path / "in.csv"
+    src.write_text("2,10,0.5\n1,5,2\n", encoding="utf-8")
+    result = runner.invoke(app, ["chem", "dilute-batch", str(src)])
+    assert result.exit_code == 1
+    assert "data row 2" in result.stdout
@@ -3,6 +3,7 @@ from pathlib import Path
 from typer.testing import CliRunner
 
 from science_ops.cli import app
+from science_ops.config import load_config
 
 runner = CliRunner()
 
@@ -20,3 +21,11 @@ def test_config_set(tmp_path, monkeypatch):
     result = runner.invoke(app, ["config", "set", "notebook_path", str(new_path)])
     assert result.exit_code == 0
     assert "lab.md" in result.stdout
+
+
+def test_config_set_rejects_negative_table_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    result = runner.invoke(app, ["config", "set", "table_cache_mb", "--", "-5"])
+    assert result.exit_code == 1
+    assert "non-negative integer" in result.stdout
+    assert load_config().table_cache_mb == 256
@@ -1,5 +1,6 @@
 from pathlib import Path
 
+import pytest
 from typer.testing import CliRunner
 
 from science_ops.cli import app
@@ -45,3 +46,126 @@ def test_data_plot(tmp_path):
     assert result.exit_code == 0
     assert "Plot y vs x" in result.stdout
     assert "*" in result.stdout
+
+
+def test_load_table_streams_in_blocks(tmp_path):
+    from science_ops.tools.data import _load_table
+
+    p = tmp_path / "big.csv"
+    p.write_text("x,y\n" + "".join(f"{i},{2 * i}\n" for i in range(10)), encoding="utf-8")
+    headers, chunks = _load_table(p, chunk_rows=3)
+    blocks = list(chunks)
+    assert headers == ["x", "y"]
+    assert [b.shape[0] for b in blocks] == [3, 3, 3, 1]
+    assert blocks[-1].tolist() == [["9", "18"]]
+
+
+def test_load_numeric_uses_disk_cache(tmp_path, monkeypatch):
+    from science_ops.tools import data
+
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "cfg"))
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    csv_path = _make_csv(tmp_path)
+
+    headers, values = data._load_numeric(csv_path)
+    assert headers == ["x", "y", "label"]
+    assert len(list(data._table_cache_dir().glob("*.npy"))) == 1
+
+    def _no_parse(*args):
+        raise AssertionError("cache miss")
+
+    monkeypatch.setattr(data, "_parse_numeric", _no_parse)
+    _, cached = data._load_numeric(csv_path)
+    assert cached.tolist()[0][:2] == [1.0, 2.0]
+
+
+def test_describe_columns_matches_describe():
+    import numpy as np
+
+    from science_ops.tools.data import _describe_columns
+    from science_ops.utils.math_helpers import describe
+
+    nan = float("nan")
+    values = np.array(
+        [
+            [1.0, nan, nan, 5.0],
+            [2.0, nan, 4.0, nan],
+            [4.0, nan, nan, 7.0],
+            [nan, nan, nan, 9.0],
+        ]
+    )
+    cols, stats = _describe_columns(values)
+    assert cols.tolist() == [0, 2, 3]
+    for j, col in enumerate(cols.tolist()):
+        data = values[:, col]
+        expected = describe(data[~np.isnan(data)])
+        got = dict(zip(["count", "mean", "std", "min", "max", "median"], (s[j] for s in stats)))
+        assert got == pytest.approx(expected)
+
+    cols, stats = _describe_columns(np.empty((0, 2)))
+    assert cols.size == 0
+
+
+def test_to_float_handles_blank_and_text_cells():
+    import numpy as np
+
+    from science_ops.tools.data import _to_float
+
+    out = _to_float(np.array(["1", "", " 2", "x", "x", "3e1"]))
+    assert np.isnan(out[[1, 3, 4]]).all()
+    assert out[[0, 2, 5]].tolist() == [1.0, 2.0, 30.0]
+    assert np.isnan(_to_float(np.array(["a", "b"]))).all()
+
+
+def test_data_summarize_sniffs_semicolon_delimiter(tmp_path):
+    p = tmp_path / "data.csv"
+    p.write_text("x;y\n1;2\n3;4\n", encoding="utf-8")
+    result = runner.invoke(app, ["data", "summarize", str(p)])
+    assert result.exit_code == 0
+    assert "x" in result.stdout
+    assert "No numeric columns" not in result.stdout
+
+
+def test_describe_columns_inf_does_not_warn():
+    import warnings
+
+    import numpy as np
+
+    from science_ops.tools.data import _describe_columns
+
+    values = np.array([[1.0, 2.0], [np.inf, 3.0], [2.0, -np.inf]])
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        _, stats = _describe_columns(values)
+    assert stats[4].tolist() == [np.inf, 3.0]
+
+
+def test_load_table_keeps_quoted_newlines_in_one_record(tmp_path):
+    from science_ops.tools.data import _load_table
+
+    p = tmp_path / "notes.csv"
+    p.write_text('id,note\n1,"two\nlines"\n2,plain\n3,"a ""quoted"" word"\n', encoding="utf-8")
+    headers, chunks = _load_table(p, chunk_rows=1)
+    blocks = [b.tolist() for b in chunks]
+    assert headers == ["id", "note"]
+    assert blocks == [[["1", "two\nlines"]], [["2", "plain"]], [["3", 'a "quoted" word']]]
+
+
+def test_parse_numeric_long_text_cell_stays_small(tmp_path):
+    import tracemalloc
+
+    from science_ops.tools.data import _parse_numeric
+
+    p = tmp_path / "notes.csv"
+    rows = [f"{i},{2 * i},{'n' * 20_000 if i == 5 else 'ok'}\n" for i in range(3000)]
+    p.write_text("x,y,note\n" + "".join(rows), encoding="utf-8")
+
+    tracemalloc.start()
+    values = _parse_numeric(p, ",", 3)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert values.shape == (3000, 3)
+    assert values[-1, :2].tolist() == [2999.0, 5998.0]
+    # A fixed-width string matrix would need rows * 20k chars * 4 bytes (~240 MB).
+    assert peak < 32 * 1024 * 1024
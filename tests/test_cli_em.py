@@ -17,3 +17,26 @@ def test_em_reactance_inductive_only():
     assert result.exit_code == 0
     assert "X_L" in result.stdout
     assert "X_total" in result.stdout
+
+
+def test_em_coulomb_batch(tmp_path):
+    src = tmp_path / "charges.csv"
+    src.write_text("q1,q2,r\n1e-6,1e-6,0.05\n1e-6,-1e-6,0.05\n", encoding="utf-8")
+    result = runner.invoke(app, ["em", "coulomb-batch", str(src)])
+    assert result.exit_code == 0
+    lines = result.stdout.strip().splitlines()
+    assert lines[0] == "q1,q2,r,force_N,sign"
+    assert lines[1].endswith(",1.0") and lines[2].endswith(",-1.0")
+
+
+def test_em_coulomb_batch_long_rows_are_not_wrapped(tmp_path):
+    import csv
+
+    src = tmp_path / "charges.csv"
+    src.write_text("q1,q2,r\n1.2345678901234567e-06,-9.876543210987654e-07,0.012345678901234567\n", encoding="utf-8")
+    result = runner.invoke(app, ["em", "coulomb-batch", str(src)])
+    assert result.exit_code == 0
+    rows = list(csv.reader(result.stdout.splitlines()))
+    assert len(rows) == 2
+    assert len(",".join(rows[1])) > 80
+    assert [len(r) for r in rows] == [5, 5]
@@ -0,0 +1,74 @@
+import importlib
+import subprocess
+import sys
+
+import typer
+
+from science_ops import cli
+
+
+def test_every_subapp_resolves_to_a_typer_app():
+    for name, module_path in cli._LAZY.items():
+        mod = importlib.import_module(module_path)
+        assert isinstance(mod.app, typer.Typer), name
+
+
+def test_importing_cli_does_not_import_tools():
+    code = (
+        "import sys, science_ops.cli; "
+        "print(sorted(m for m in sys.modules if m.startswith('science_ops.tools.')))"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "[]"
+
+
+def test_subapp_meta_matches_module_help():
+    assert list(cli._SUBAPP_META) == list(cli._LAZY)
+    for name, module_path in cli._LAZY.items():
+        mod = importlib.import_module(module_path)
+        assert cli._SUBAPP_META[name] == mod.app.info.help, name
+
+
+def test_top_level_help_does_not_import_tools():
+    code = (
+        "import sys\n"
+        "from typer.testing import CliRunner\n"
+        "from science_ops.cli import app\n"
+        "result = CliRunner().invoke(app, ['--help'])\n"
+        "assert 'relativity' in result.stdout, result.stdout\n"
+        "print(sorted(m for m in sys.modules if m.startswith('science_ops.tools.')))"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip().splitlines()[-1] == "[]"
+
+
+def test_importing_tools_does_not_import_numpy():
+    code = (
+        "import importlib, sys\n"
+        "from science_ops.cli import _LAZY\n"
+        "for m in _LAZY.values(): importlib.import_module(m)\n"
+        "print('numpy' in sys.modules)"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "False"
+
+
+def test_shared_console_is_built_on_first_use():
+    code = (
+        "import sys, science_ops.cli, science_ops.tools.chem\n"
+        "print('rich.console' in sys.modules)\n"
+        "from science_ops.ui import console\n"
+        "console.width\n"
+        "print('rich.console' in sys.modules)"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.split() == ["False", "True"]
+
+
+def test_list_commands_has_no_duplicates_after_loading():
+    group = typer.main.get_command(cli.app)
+    ctx = group.make_context("ops", [])
+    assert group.get_command(ctx, "em") is not None
+    names = group.list_commands(ctx)
+    assert len(names) == len(set(names))
+    assert names.count("em") == 1
@@ -19,3 +19,16 @@ def test_notebook_set_path(tmp_path):
     assert result2.exit_code == 0
     assert new_path.exists()
     assert "hello" in new_path.read_text()
+
+
+def test_notebook_log_batch_from_stdin(tmp_path):
+    env = {"XDG_CONFIG_HOME": str(tmp_path)}
+    new_path = tmp_path / "lab.md"
+    runner.invoke(app, ["notebook", "set-path", str(new_path)], env=env)
+
+    result = runner.invoke(app, ["notebook", "log-batch"], input="first\n\nsecond\n", env=env)
+    assert result.exit_code == 0
+    assert "Logged 2 entries" in result.stdout
+    lines = new_path.read_text().splitlines()
+    assert len(lines) == 2
+    assert lines[0].endswith("] first") and lines[1].endswith("] second")
@@ -9,3 +9,12 @@ def test_waves_sine():
     result = runner.invoke(app, ["waves", "sine", "--freq", "1", "--samples", "20"])
     assert result.exit_code == 0
     assert "*" in result.stdout
+
+
+def test_waves_square_levels():
+    result = runner.invoke(app, ["waves", "square", "--freq", "2", "--samples", "20"])
+    assert result.exit_code == 0
+    lines = result.stdout.splitlines()
+    # High samples land on the top row, low samples on the bottom row.
+    assert "*" in lines[0] and "*" in lines[-1]
+    assert all(line.strip() == "" for line in lines[1:-1])
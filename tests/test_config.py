@@ -12,3 +12,43 @@ def test_config_round_trip(tmp_path, monkeypatch):
 
     loaded = load_config()
     assert loaded.notebook_path == cfg.notebook_path
+
+
+def test_load_config_returns_independent_copies(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    save_config(Config(notebook_path=tmp_path / "note.md"))
+
+    first = load_config()
+    first.default_body = "mars"
+    assert load_config().default_body is None
+
+
+def test_load_config_sees_external_edits(tmp_path, monkeypatch):
+    import json
+    import os
+
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    save_config(Config(notebook_path=tmp_path / "note.md"))
+    assert load_config().default_body is None
+
+    cf = tmp_path / "science_ops" / "science_ops_config.json"
+    st = cf.stat()
+    data = json.loads(cf.read_text())
+    data["default_body"] = "mars"
+    cf.write_text(json.dumps(data))
+    # Same mtime as before: the size change alone must invalidate the cache.
+    os.utime(cf, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert load_config().default_body == "mars"
+
+
+def test_load_config_ignores_malformed_table_cache_mb(tmp_path, monkeypatch):
+    import json
+
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    cf = tmp_path / "science_ops" / "science_ops_config.json"
+    cf.parent.mkdir(parents=True, exist_ok=True)
+    for bad in (None, "1.5", 1.5, -3, True):
+        cf.write_text(json.dumps({"notebook_path": str(tmp_path / "n.md"), "table_cache_mb": bad}))
+        assert load_config().table_cache_mb == Config.default().table_cache_mb, bad
+    cf.write_text(json.dumps({"notebook_path": str(tmp_path / "n.md"), "table_cache_mb": 0}))
+    assert load_config().table_cache_mb == 0
@@ -4,3 +4,28 @@ from science_ops.tools.constants import CONSTANTS
 def test_constants_has_speed_of_light():
     assert "c" in CONSTANTS
     assert CONSTANTS["c"]["unit"] == "m/s"
+
+
+def test_get_constant_fuzzy_matches_name_and_symbol():
+    from typer.testing import CliRunner
+
+    from science_ops.tools.constants import app
+
+    runner = CliRunner()
+    result = runner.invoke(app, ["get", "planck"])
+    assert result.exit_code == 0
+    assert "h - Planck constant" in result.output
+
+    result = runner.invoke(app, ["get", "K_b"])
+    assert result.exit_code == 0
+    assert "Boltzmann" in result.output
+
+
+def test_get_constant_ignores_diacritics():
+    from typer.testing import CliRunner
+
+    from science_ops.tools.constants import app
+
+    result = CliRunner().invoke(app, ["get", "Böltzmann"])
+    assert result.exit_code == 0
+    assert "Boltzmann constant" in result.output
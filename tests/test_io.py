@@ -0,0 +1,40 @@
+from science_ops.utils.io import append_line, append_lines
+
+
+def test_append_helpers_create_parent_once(tmp_path):
+    path = tmp_path / "nested" / "notes.md"
+    append_line(path, "first  ")
+    assert append_lines(path, ["second", "third\n"]) == 2
+    assert path.read_text(encoding="utf-8") == "first\nsecond\nthird\n"
+
+
+def test_timestamp_is_iso_seconds():
+    from datetime import datetime
+
+    from science_ops.utils.io import timestamp
+
+    stamp = timestamp()
+    assert datetime.fromisoformat(stamp).isoformat(timespec="seconds") == stamp
+
+
+def test_read_numeric_rows_sniffs_delimiter_and_strips_bom(tmp_path):
+    from science_ops.utils.io import read_numeric_rows
+
+    semi = tmp_path / "semi.csv"
+    semi.write_text("moles;volume_l\n0.5;1\n", encoding="utf-8")
+    assert read_numeric_rows(semi, 2).tolist() == [[0.5, 1.0]]
+
+    bom = tmp_path / "bom.csv"
+    bom.write_text("0.5,1\n2,4\n", encoding="utf-8-sig")
+    assert read_numeric_rows(bom, 2).tolist() == [[0.5, 1.0], [2.0, 4.0]]
+
+
+def test_format_numeric_rows_round_trips():
+    import numpy as np
+
+    from science_ops.utils.io import format_numeric_rows
+
+    rows = np.array([[0.1, 1 / 3], [6.02214076e23, 1234567.891]])
+    text = format_numeric_rows(["a", "b"], rows)
+    parsed = [[float(x) for x in line.split(",")] for line in text.splitlines()[1:]]
+    assert parsed == rows.tolist()
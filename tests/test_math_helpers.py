@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from science_ops.utils.math_helpers import describe
+
+
+@pytest.mark.parametrize("n", [1, 2, 3, 4, 7, 100])
+def test_describe_matches_numpy(n):
+    arr = np.random.default_rng(n).normal(size=n)
+    stats = describe(arr)
+    assert stats["count"] == n
+    assert stats["mean"] == pytest.approx(arr.mean())
+    assert stats["std"] == pytest.approx(arr.std(ddof=1) if n > 1 else 0.0)
+    assert stats["min"] == arr.min()
+    assert stats["max"] == arr.max()
+    assert stats["median"] == pytest.approx(np.median(arr))
+
+
+def test_describe_rejects_empty():
+    with pytest.raises(ValueError):
+        describe([])
+
+
+def test_normal_cdf_array_matches_erf():
+    import math
+
+    from science_ops.utils.math_helpers import normal_cdf_array
+
+    xs = [-3.0, -0.5, 0.0, 1.0, 2.5]
+    expected = [0.5 * (1.0 + math.erf((x - 1.0) / (2.0 * math.sqrt(2.0)))) for x in xs]
+    assert normal_cdf_array(xs, mu=1.0, sigma=2.0).tolist() == pytest.approx(expected)
+    with pytest.raises(ValueError):
+        normal_cdf_array(xs, sigma=0.0)
+
+
+def test_describe_accepts_lists_generators_and_arrays():
+    expected = describe(np.array([1.0, 2.0, 4.0]))
+    assert describe([1, 2, 4]) == expected
+    assert describe(x for x in (1.0, 2.0, 4.0)) == expected
+    assert describe(np.array([1, 2, 4], dtype=np.int32)) == expected
+
+
+@pytest.mark.parametrize("values", [[1.0, 2.0, float("nan")], [3.0, float("nan"), 1.0, 2.0]])
+def test_describe_propagates_nan_like_numpy(values):
+    stats = describe(values)
+    arr = np.array(values)
+    for key, expected in (("min", arr.min()), ("max", arr.max()), ("median", np.median(arr))):
+        assert np.isnan(expected) and np.isnan(stats[key]), key
+
+
+def test_describe_inf_does_not_warn():
+    import warnings
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        stats = describe([1.0, float("inf")])
+    assert stats["max"] == float("inf")
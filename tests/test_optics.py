@@ -0,0 +1,26 @@
+import math
+
+import pytest
+
+from science_ops.tools import optics
+
+
+def test_snell_batch_matches_scalar_and_flags_tir():
+    angles = [0.0, 30.0, 41.0, 42.0, 80.0]
+    out = optics.snell_batch(1.5, 1.0, angles)
+    for theta1, theta2 in zip(angles, out.tolist()):
+        sin_theta2 = 1.5 * math.sin(math.radians(theta1))
+        if abs(sin_theta2) > 1.0:
+            assert math.isnan(theta2)
+        else:
+            assert theta2 == pytest.approx(math.degrees(math.asin(sin_theta2)))
+    with pytest.raises(ValueError):
+        optics.snell_batch(0.0, 1.0, angles)
+
+
+def test_thin_lens_batch_matches_scalar():
+    d_o = [30.0, 5.0, 10.0, 10.0 * (1 + 1e-15)]
+    out = optics.thin_lens_batch(10.0, d_o).tolist()
+    assert out == pytest.approx([optics._thin_lens(10.0, d) for d in d_o])
+    assert out[0] == pytest.approx(15.0)
+    assert math.isinf(out[2]) and math.isinf(out[3])
@@ -0,0 +1,13 @@
+import pytest
+
+from science_ops.tools import physics_constants
+
+
+def test_get_body_is_memoized_and_case_insensitive():
+    physics_constants.get_body.cache_clear()
+    earth = physics_constants.get_body("earth")
+    assert physics_constants.get_body("earth") is earth
+    assert physics_constants.get_body("EARTH") is earth
+    assert physics_constants.get_body.cache_info().hits == 1
+    with pytest.raises(KeyError):
+        physics_constants.get_body("pluto")
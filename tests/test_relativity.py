@@ -1,6 +1,16 @@
+import pytest
+
 from science_ops.tools import relativity
 
 
 def test_gamma_beta_zero_is_one():
     gamma = relativity._gamma_from_beta(0.0)
     assert abs(gamma - 1.0) < 1e-12
+
+
+def test_gamma_array_matches_scalar():
+    betas = [0.0, 0.1, 0.5, 0.9, 0.999999]
+    expected = [relativity._gamma_from_beta(b) for b in betas]
+    assert relativity.gamma_array(betas).tolist() == pytest.approx(expected)
+    with pytest.raises(ValueError):
+        relativity.gamma_array([0.5, 1.0])
@@ -1,5 +1,30 @@
+import pytest
+
 from science_ops.tools.units import DIMENSIONS
 
 
 def test_units_length_contains_meters():
     assert "m" in DIMENSIONS["length"]
+
+
+def test_unit_index_covers_every_unit():
+    from science_ops.tools.units import UNIT_INDEX, find_dimension
+
+    for dim, table in DIMENSIONS.items():
+        for unit, (scale, _) in table.items():
+            assert UNIT_INDEX[unit] == (dim, scale)
+    assert find_dimension("km/h") == "velocity"
+    assert find_dimension("furlong") is None
+
+
+def test_ratio_is_cached_and_validates():
+    from science_ops.tools.units import _ratio
+
+    _ratio.cache_clear()
+    assert _ratio("km", "m") == 1000.0
+    assert _ratio("km", "m") == 1000.0
+    assert _ratio.cache_info().hits == 1
+    with pytest.raises(ValueError, match="Incompatible"):
+        _ratio("km", "s")
+    with pytest.raises(ValueError, match="Unknown unit: parsec"):
+        _ratio("parsec", "m")